@@ -1,8 +1,24 @@
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Opt-in native build: CFGPP_USE_MYPYC=1 compiles the lexer and parser with mypyc.
+# They are compiled together so the parser's Token accesses and lexer calls are
+# native. The pure-Python package is built otherwise and behaves identically.
+ext_modules = []
+if os.environ.get("CFGPP_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "src/cfgpp/core/lexer.py",
+            "src/cfgpp/core/parser.py",
+        ]
+    )
+
 setup(
     name="cfgpp",
     version="0.1.0",
@@ -14,6 +30,7 @@ setup(
     url="https://github.com/jonobg/cfgpp-format",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
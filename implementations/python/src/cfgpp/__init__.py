@@ -5,7 +5,7 @@ Parses CFG++ configuration files. Seems to work reasonably well.
 """
 # Core CFGPP functionality
 from .core.parser import parse_string, parse_file, loads, load
-from .core.lexer import lex, LexerError, Token
+from .core.lexer import lex, lex_cached, LexerError, Token
 from .core.formatter import format_string
 
 __version__ = "1.2.0"
@@ -15,6 +15,7 @@ __all__ = [
     "parse_string",
     "parse_file", 
     "lex",
+    "lex_cached",
     "LexerError",
     "Token",
     "format_string",
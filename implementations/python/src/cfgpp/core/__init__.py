@@ -4,19 +4,28 @@ CFGPP Core Library
 Core parsing, lexing, and formatting functionality.
 """
 
-from .lexer import lex, Token, LexerError
-from .parser import parse_string, parse_file, loads, load, ConfigParseError
+from .lexer import lex, lex_cached, Token, LexerError
+from .parser import (
+    parse_string,
+    parse_file,
+    loads,
+    load,
+    clear_include_cache,
+    ConfigParseError,
+)
 from .formatter import format_string, format_file, CfgppFormatter
 
 __all__ = [
     # Lexer
     "lex",
+    "lex_cached",
     "Token",
     "LexerError",
     # Parser (new clear API)
     "parse_string",
     "parse_file",
     "ConfigParseError",
+    "clear_include_cache",
     # Parser (legacy aliases)
     "loads",
     "load",
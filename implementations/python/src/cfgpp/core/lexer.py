@@ -8,7 +8,25 @@ Lexer for the CFG++ configuration format.
 """
 
 import re
-from typing import List, Dict, Tuple, Optional, Pattern, Match, Any
+import string
+import sys
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional, Pattern, Match, Any, NamedTuple
+
+# Token types are interned so callers can compare them with ``is``
+T_WHITESPACE = sys.intern("WHITESPACE")
+T_COMMENT = sys.intern("COMMENT")
+T_INCLUDE = sys.intern("INCLUDE")
+T_ENV = sys.intern("ENV_VAR")
+T_STRING = sys.intern("STRING")
+T_NUMBER = sys.intern("NUMBER")
+T_BOOL = sys.intern("BOOLEAN")
+T_ENUM = sys.intern("ENUM")
+T_NULL = sys.intern("NULL")
+T_NAMESPACE = sys.intern("NAMESPACE")
+T_OPERATOR = sys.intern("OPERATOR")
+T_PUNCT = sys.intern("PUNCTUATION")
+T_IDENT = sys.intern("IDENTIFIER")
 
 # REASONING: Token specifications enable pattern matching and syntax element identification for lexical workflows.
 # Lexical workflows require token specifications for pattern matching and syntax element identification in lexical workflows.
@@ -18,74 +36,117 @@ TOKEN_SPECS = [
     # REASONING: Whitespace tokenization enables proper parsing and formatting preservation for parsing workflows.
     # Parsing workflows require whitespace tokenization for proper parsing and formatting preservation in parsing workflows.
     # Whitespace tokenization supports proper parsing, formatting preservation, and parsing coordination.
-    ("WHITESPACE", r"\s+"),
+    (T_WHITESPACE, r"\s+"),
     # REASONING: Comment recognition enables documentation support and code annotation for documentation workflows.
     # Documentation workflows require comment recognition for documentation support and code annotation in documentation workflows.
     # Comment recognition supports documentation support, code annotation, and documentation coordination.
-    ("COMMENT", r"//.*?$|/\*.*?\*/", re.DOTALL | re.MULTILINE),
+    (T_COMMENT, r"//.*?$|/\*.*?\*/", re.DOTALL | re.MULTILINE),
     # REASONING: Include directive recognition enables modular configuration and file composition for composition workflows.
     # Composition workflows require include directive recognition for modular configuration and file composition in composition workflows.
     # Include directive recognition supports modular configuration, file composition, and composition coordination.
-    ("INCLUDE", r"@(?:include|import)"),
+    (T_INCLUDE, r"@(?:include|import)"),
     # REASONING: Environment variable recognition enables dynamic configuration and runtime substitution for substitution workflows.
     # Substitution workflows require environment variable recognition for dynamic configuration and runtime substitution in substitution workflows.
     # Environment variable recognition supports dynamic configuration, runtime substitution, and substitution coordination.
-    ("ENV_VAR", r"\$\{[a-zA-Z_][a-zA-Z0-9_]*(?::-[^}]*)?\}"),
+    (T_ENV, r"\$\{[a-zA-Z_][a-zA-Z0-9_]*(?::-[^}]*)?\}"),
     # REASONING: String literal recognition enables text value processing and quoted content handling for text workflows.
     # Text workflows require string literal recognition for text value processing and quoted content handling in text workflows.
     # String literal recognition supports text value processing, quoted content handling, and text coordination.
-    ("STRING", r'"(?:\\.|[^"\\])*"'),
+    (T_STRING, r'"(?:\\.|[^"\\])*"'),
     # REASONING: Number recognition enables numeric value processing and mathematical operations for numeric workflows.
     # Numeric workflows require number recognition for numeric value processing and mathematical operations in numeric workflows.
     # Number recognition supports numeric value processing, mathematical operations, and numeric coordination.
-    ("NUMBER", r"\d+(\.\d+)?([eE][+-]?\d+)?"),
+    (T_NUMBER, r"\d+(\.\d+)?([eE][+-]?\d+)?"),
     # REASONING: Boolean recognition enables logical value processing and true/false handling for boolean workflows.
     # Boolean workflows require boolean recognition for logical value processing and true/false handling in boolean workflows.
     # Boolean recognition supports logical value processing, true/false handling, and boolean coordination.
-    ("BOOLEAN", r"true|false"),
+    (T_BOOL, r"true|false"),
     # REASONING: Enum keyword recognition enables enumeration type definitions and value constraint specification for enum workflows.
     # Enum workflows require enum keyword recognition for enumeration type definitions and value constraint specification in enum workflows.
     # Enum keyword recognition supports enumeration type definitions, value constraint specification, and enum coordination.
-    ("ENUM", r"enum"),
+    (T_ENUM, r"enum"),
     # REASONING: Null recognition enables empty value processing and null state handling for null workflows.
     # Null workflows require null recognition for empty value processing and null state handling in null workflows.
     # Null recognition supports empty value processing, null state handling, and null coordination.
-    ("NULL", r"null"),
+    (T_NULL, r"null"),
     # REASONING: Namespace recognition enables scope separation and hierarchical organization for namespace workflows.
     # Namespace workflows require namespace recognition for scope separation and hierarchical organization in namespace workflows.
     # Namespace recognition supports scope separation, hierarchical organization, and namespace coordination.
-    ("NAMESPACE", r"::"),
+    (T_NAMESPACE, r"::"),
     # REASONING: Comparison operator recognition enables validation rules and conditional expressions for comparison workflows.
     # Comparison workflows require comparison operator recognition for validation rules and conditional expressions in comparison workflows.
     # Comparison operator recognition supports validation rules, conditional expressions, and comparison coordination.
-    ("OPERATOR", r"(>=|<=|==|!=|&&|\|\||[+\-*\/><!&|])"),
+    (T_OPERATOR, r"(>=|<=|==|!=|&&|\|\||[+\-*\/><!&|])"),
     # REASONING: Punctuation recognition enables structural parsing and syntax delimitation for structural workflows.
     # Structural workflows require punctuation recognition for structural parsing and syntax delimitation in structural workflows.
     # Punctuation recognition supports structural parsing, syntax delimitation, and structural coordination.
-    ("PUNCTUATION", r"[\{\}\(\)\[\],;=\.]"),
+    (T_PUNCT, r"[\{\}\(\)\[\],;=\.]"),
     # REASONING: Identifier recognition enables variable names and key identification for identification workflows.
     # Identification workflows require identifier recognition for variable names and key identification in identification workflows.
     # Identifier recognition supports variable names, key identification, and identification coordination.
-    ("IDENTIFIER", r"[a-zA-Z_][a-zA-Z0-9_]*"),
+    (T_IDENT, r"[a-zA-Z_][a-zA-Z0-9_]*"),
 ]
 
 
+# Prebuilt token dicts for single-character punctuation; lex() copies one per token
+_PUNCT_TEMPLATES = {
+    char: {"type": T_PUNCT, "value": char, "line": 0, "col": 0} for char in "{}()[],;=."
+}
+
+
+# Characters that are valid wherever they appear; translate() deletes them in bulk
+_STANDALONE_CHARS = (
+    string.ascii_letters + string.digits + string.whitespace + "_{}()[],;=.<>!&|+-*/"
+)
+_DROP_STANDALONE = str.maketrans(dict.fromkeys(_STANDALONE_CHARS))
+_UNICODE_STANDALONE = re.compile(r"[\s\d]")  # Non-ASCII whitespace/digits still lex
+# Characters that start or fill a span; lex() rejects them where no span matches
+_SPAN_CHARS = frozenset('"\\$@:')
+# Multi-character constructs that may legally contain any other character
+_EXEMPT_SPANS = re.compile(
+    r"//[^\n]*|/\*.*?\*/"  # Comments
+    r'|"(?:\\[^\n]|[^"\\])*"'  # Strings, whose escapes stop at line breaks
+    r"|\$\{[a-zA-Z_][a-zA-Z0-9_]*(?::-[^}]*)?\}"  # Environment variables
+    r"|@(?:include|import)|::",  # Directives and namespace separators
+    re.DOTALL,
+)
+
+
+def _find_illegal_character(text: str) -> int:
+    """Return the index of the first character no token can start with, or -1."""
+    # Whatever survives the deletion may only appear inside strings, comments, etc.
+    residue = set(text.translate(_DROP_STANDALONE))
+    suspicious = {char for char in residue if not _UNICODE_STANDALONE.match(char)}
+    if suspicious <= _SPAN_CHARS:
+        return -1  # A misplaced span character is where lex() stops anyway
+
+    # Search for a suspicious character only between exempt spans
+    suspicious_re = re.compile(f"[{re.escape(''.join(suspicious))}]")
+    pos = 0
+    for span in _EXEMPT_SPANS.finditer(text):
+        found = suspicious_re.search(text, pos, span.start())
+        if found:
+            return found.start()
+        pos = span.end()
+    found = suspicious_re.search(text, pos)
+    return found.start() if found else -1
+
+
 # REASONING: Token class enables lexical unit representation and parser integration for token workflows.
 # Token workflows require token class for lexical unit representation and parser integration in token workflows.
 # Token class supports lexical unit representation, parser integration, and token coordination while enabling
 # comprehensive token strategies and systematic lexical workflows.
-class Token:
-    """Represents a token in the CFG++ configuration."""
-
-    # REASONING: Constructor enables token initialization and attribute assignment for initialization workflows.
-    # Initialization workflows require constructor for token initialization and attribute assignment in initialization workflows.
-    # Constructor supports token initialization, attribute assignment, and initialization coordination while enabling
-    # comprehensive constructor strategies and systematic initialization workflows.
-    def __init__(self, type_: str, value: str, line: int, column: int):
-        self.type = type_  # Token category (IDENTIFIER, STRING, etc.)
-        self.value = value  # Actual text content
-        self.line = line  # Line number for error reporting
-        self.column = column  # Column position for precise location
+class Token(NamedTuple):
+    """Represents a token in the CFG++ configuration.
+
+    Tokens are immutable tuples, so instances returned by :func:`lex_cached`
+    can be shared between callers. Equality and hashing compare by content.
+    """
+
+    type: str  # Token category (IDENTIFIER, STRING, etc.)
+    value: str  # Actual text content
+    line: int  # Line number for error reporting
+    column: int  # Column position for precise location
 
     # REASONING: Dictionary conversion enables parser compatibility and data structure integration for compatibility workflows.
     # Compatibility workflows require dictionary conversion for parser compatibility and data structure integration in compatibility workflows.
@@ -100,6 +161,16 @@ class Token:
             "col": self.column,  # Note: 'col' for parser compatibility
         }
 
+    def __getitem__(self, key: Any) -> Any:
+        """Support ``token["type"]``-style access used by dictionary-based callers."""
+        if key == "col":
+            return self.column
+        if key in ("type", "value", "line"):
+            return getattr(self, key)
+        if isinstance(key, str):
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)  # Positional access, as for any tuple
+
     # REASONING: String representation enables debugging support and development visibility for debugging workflows.
     # Debugging workflows require string representation for debugging support and development visibility in debugging workflows.
     # String representation supports debugging support, development visibility, and debugging coordination while enabling
@@ -144,11 +215,20 @@ def lex(text: str) -> List[Dict[str, Any]]:
     Raises:
         LexerError: If an unexpected character is encountered
     """
+    # Reject illegal characters before tokenizing, reporting the first one's position
+    illegal = _find_illegal_character(text)
+    if illegal >= 0:
+        bad_line = text.count("\n", 0, illegal) + 1
+        bad_column = illegal - text.rfind("\n", 0, illegal)
+        raise LexerError(f"Unexpected character: {text[illegal]}", bad_line, bad_column)
+
     # REASONING: Token collection and position tracking enable parsing state management and location awareness for tracking workflows.
     # Tracking workflows require token collection and position tracking for parsing state management and location awareness in tracking workflows.
     # Token collection and position tracking support parsing state management, location awareness, and tracking coordination while enabling
     # comprehensive collection strategies and systematic tracking workflows.
-    tokens: List[Token] = []
+    estimate = max(16, len(text) // 4)  # Typical tokens-per-character ratio
+    tokens: List[Optional[Dict[str, Any]]] = [None] * estimate
+    count = 0  # Number of tokens emitted so far
     line = 1  # Current line number for error reporting
     column = 1  # Current column position for precise location
     pos = 0  # Current position in input text
@@ -169,6 +249,20 @@ def lex(text: str) -> List[Dict[str, Any]]:
     # Main tokenization loop supports sequential text processing, token extraction, and processing coordination while enabling
     # comprehensive loop strategies and systematic processing workflows.
     while pos < len(text):
+        # Punctuation needs no regex: copy its template (unless '==' starts here)
+        template = _PUNCT_TEMPLATES.get(text[pos])
+        if template is not None and not text.startswith("==", pos):
+            if count >= len(tokens):
+                tokens.extend([None] * len(tokens))  # Grow geometrically on demand
+            token = template.copy()  # Cheaper than building a fresh 4-key dict
+            token["line"] = line
+            token["col"] = column
+            tokens[count] = token
+            count += 1
+            pos += 1
+            column += 1
+            continue
+
         match = None
 
         # REASONING: Pattern matching iteration enables token type recognition and syntax element identification for recognition workflows.
@@ -185,7 +279,7 @@ def lex(text: str) -> List[Dict[str, Any]]:
                 # Formatting workflows require whitespace and comment handling for formatting preservation and documentation support in formatting workflows.
                 # Whitespace and comment handling supports formatting preservation, documentation support, and formatting coordination while enabling
                 # comprehensive handling strategies and systematic formatting workflows.
-                if token_type in ("WHITESPACE", "COMMENT"):
+                if token_type is T_WHITESPACE or token_type is T_COMMENT:
                     # REASONING: Line and column tracking enables position accuracy and error location for location workflows.
                     # Location workflows require line and column tracking for position accuracy and error location in location workflows.
                     # Line and column tracking supports position accuracy, error location, and location coordination while enabling
@@ -204,14 +298,28 @@ def lex(text: str) -> List[Dict[str, Any]]:
                 # Creation workflows require token creation for lexical unit instantiation and parser preparation in creation workflows.
                 # Token creation supports lexical unit instantiation, parser preparation, and creation coordination while enabling
                 # comprehensive creation strategies and systematic instantiation workflows.
-                tokens.append(Token(token_type, value, line, column))
+                if token_type is T_IDENT:
+                    value = sys.intern(value)  # One shared string per identifier name
+                if count >= len(tokens):
+                    tokens.extend([None] * len(tokens))  # Grow geometrically on demand
+                tokens[count] = {
+                    "type": token_type,
+                    "value": value,
+                    "line": line,
+                    "col": column,  # Note: 'col' for parser compatibility
+                }
+                count += 1
 
                 # REASONING: Position advancement enables text progression and parsing continuation for advancement workflows.
                 # Advancement workflows require position advancement for text progression and parsing continuation in advancement workflows.
                 # Position advancement supports text progression, parsing continuation, and advancement coordination while enabling
                 # comprehensive advancement strategies and systematic progression workflows.
                 pos = match.end()
-                column += len(value)  # Advance column position
+                if "\n" in value and (token_type is T_STRING or token_type is T_ENV):
+                    line += value.count("\n")  # Strings and defaults may span lines
+                    column = len(value) - value.rfind("\n")
+                else:
+                    column += len(value)  # Advance column position
                 break
 
         # REASONING: Error handling enables invalid character detection and diagnostic reporting for error workflows.
@@ -221,19 +329,35 @@ def lex(text: str) -> List[Dict[str, Any]]:
         if not match:
             raise LexerError(f"Unexpected character: {text[pos]}", line, column)
 
-    # REASONING: Token conversion and filtering enables parser compatibility and output preparation for conversion workflows.
-    # Conversion workflows require token conversion and filtering for parser compatibility and output preparation in conversion workflows.
-    # Token conversion and filtering support parser compatibility, output preparation, and conversion coordination while enabling
-    # comprehensive conversion strategies and systematic preparation workflows.
-    return [
-        token.to_dict()
-        for token in tokens
-        if token.type not in ("WHITESPACE", "COMMENT")
-    ]
+    return tokens[:count]  # Whitespace and comments are never emitted
+
+
+@lru_cache(maxsize=128)
+def lex_cached(text: str) -> Tuple[Token, ...]:
+    """
+    Tokenize the input text, reusing the result for previously seen inputs.
+
+    Build tools and the language server re-lex the same documents many times;
+    identical inputs are served from an LRU cache instead of being tokenized
+    again. Use ``lex_cached.cache_clear()`` to drop cached results.
+
+    Args:
+        text: The input text to tokenize
+
+    Returns:
+        A tuple of immutable Token objects
+
+    Raises:
+        LexerError: If an unexpected character is encountered
+    """
+    return tuple(
+        Token(token["type"], token["value"], token["line"], token["col"])
+        for token in lex(text)
+    )
 
 
 # REASONING: Module exports enable API definition and interface specification for export workflows.
 # Export workflows require module exports for API definition and interface specification in export workflows.
 # Module exports support API definition, interface specification, and export coordination while enabling
 # comprehensive export strategies and systematic interface workflows.
-__all__ = ["lex", "LexerError", "Token"]
+__all__ = ["lex", "lex_cached", "LexerError", "Token"]
@@ -1,30 +1,204 @@
 """
 A simple parser for the CFG++ configuration format.
 
-# REASONING: Parser enables syntax analysis and configuration structure recognition for parsing workflows.
-# Parsing workflows require parser for syntax analysis and configuration structure recognition in parsing workflows.
-# Parser supports syntax analysis, configuration structure recognition, and parsing coordination while enabling
-# comprehensive parser strategies and systematic parsing workflows.
 """
 
+import operator
 import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set, Tuple
-from .lexer import lex, Token, LexerError
+from typing import List, Dict, Any, Optional, Sequence, Set, Tuple
+from .lexer import (
+    lex,
+    Token,
+    LexerError,
+    T_BOOL,
+    T_ENUM,
+    T_ENV,
+    T_IDENT,
+    T_INCLUDE,
+    T_NAMESPACE,
+    T_NUMBER,
+    T_OPERATOR,
+    T_PUNCT,
+    T_STRING,
+)
+
+_TOKEN_SPEC = [
+    ("STRING", r'"(?:\\.|[^"\\])*"'),  # Quoted strings with escape support
+    ("NUMBER", r"\d+(?:\.\d+)?"),  # Integer and floating-point numbers
+    ("NAMESPACE", r"::"),  # Namespace operator
+    ("IDENTIFIER", r"[a-zA-Z_][a-zA-Z0-9_]*"),  # ASCII; true/false are retagged later
+    ("PUNCTUATION", r"[\{\}\(\)\[\],;=]"),  # Structural punctuation
+    ("END", r"\Z"),  # End of input, so trailing whitespace and comments match too
+    ("INVALID", r"."),  # Any other character, reported as unexpected
+]
+
+# Whitespace (including line breaks) and single-line comments
+_SKIP_PATTERN = r"\s*(?://[^\n]*\s*)*"
+_SKIP_RE = re.compile(_SKIP_PATTERN)
+
+# Each match swallows the whitespace and comments before a token inside the regex
+# engine, then captures the token in one positional group (patterns use only
+# non-capturing groups inside), so ``mo.lastindex`` identifies the token kind.
+# The INVALID catch-all means the alternation never fails after the skip, so
+# the engine never backtracks into it and no offset is scanned twice.
+_TOKEN_GROUPS = "|".join(f"({pattern})" for _, pattern in _TOKEN_SPEC)
+_TOKEN_RE = re.compile(
+    _SKIP_PATTERN + "(?:" + _TOKEN_GROUPS + ")",
+    re.DOTALL,  # Lets escapes inside strings span line breaks
+)
+
+# Maps resolved include path -> (parsed result, {file: (mtime_ns, size)} for it and
+# its includes), least recently used first
+_INCLUDE_CACHE: Dict[Path, Tuple[Dict[str, Any], Dict[Path, Tuple[int, int]]]] = {}
+_INCLUDE_CACHE_SIZE = 128  # Same bound as the _lex_columns cache
+
+
+def clear_include_cache() -> None:
+    """Forget all cached include parse results."""
+    _INCLUDE_CACHE.clear()
+
+
+def _cache_include(
+    path: Path, entry: Tuple[Dict[str, Any], Dict[Path, Tuple[int, int]]]
+) -> None:
+    """Store ``entry`` as the most recently used include result, evicting the oldest."""
+    _INCLUDE_CACHE.pop(path, None)  # Re-inserting moves it to the end
+    _INCLUDE_CACHE[path] = entry
+    if len(_INCLUDE_CACHE) > _INCLUDE_CACHE_SIZE:
+        _INCLUDE_CACHE.pop(next(iter(_INCLUDE_CACHE)), None)
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    """Return the (mtime_ns, size) pair used to detect include file changes."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _maybe_lift_params(result: Dict[str, Any], value: Any) -> None:
+    """Copy a value's 'params' up next to it, where tests and tools expect them."""
+    params = value.get("params") if type(value) is dict else None
+    if params is not None:
+        result["params"] = params
+
+
+def _copy_tree(node: Any) -> Any:
+    """Copy the dicts and lists of a parse result; other values are immutable scalars.
+
+    Cheaper than ``copy.deepcopy``, which tracks a memo and dispatches per type.
+    """
+    if type(node) is dict:
+        return {key: _copy_tree(value) for key, value in node.items()}
+    if type(node) is list:
+        return [_copy_tree(item) for item in node]
+    return node
+
+
+_EXPR_STARTERS = frozenset({T_STRING, T_NUMBER, T_BOOL, T_ENV, T_IDENT})
+_ARITH_OPS = frozenset({"+", "-", "*", "/"})
+_END_TOKENS = frozenset({",", ";", "="})  # Keep a top-level object unwrapped
+_SEPARATORS = frozenset({",", ";"})  # Optional separators between body members
+_PAIR_FOLLOWERS = frozenset({"=", "["})  # Tokens after a plain key
+_BINARY_PREC = {"+": 1, "-": 1, "*": 2, "/": 2}  # Binary operator precedence
+_NUMERIC_TYPES = frozenset({"integer", "float"})
+_BOOLEAN_WORDS = frozenset({"true", "false"})  # Lower-cased boolean spellings
+_BOOLEAN_VALUES = {"true": True, "false": False}  # Spellings the lexer emits
+# Parameter types that are never enum references
+_BUILTIN_TYPES = frozenset({"string", "int", "float", "boolean", "array", "object"})
+# Arithmetic stays on Python objects: each operation is a single scalar, so a
+# native-call boundary would cost more than the operation itself, and integer
+# results must keep arbitrary precision and their "integer" type.
+_NUM_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+# Regex group names mapped onto the lexer's interned token types
+_GROUP_TYPES = {
+    "STRING": T_STRING,
+    "NUMBER": T_NUMBER,
+    "NAMESPACE": T_NAMESPACE,
+    "IDENTIFIER": T_IDENT,
+    "PUNCTUATION": T_PUNCT,
+}
+
+# Token type per regex group number; None marks the end of input or a bad character
+_INDEX_TYPES = (None,) + tuple(_GROUP_TYPES.get(name) for name, _ in _TOKEN_SPEC)
+
+
+# Every text int() or float() accepts starts like this (after optional whitespace
+# and sign): a digit, a fraction, or inf/infinity/nan. Anything else is a string.
+_NUMBER_LIKE_RE = re.compile(r"\s*[+-]?(?:\d|\.\d|inf|nan)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _classify_env_value(text: str) -> Tuple[str, Any]:
+    """Infer the (type, value) of an environment variable's text.
+
+    Booleans are matched case-insensitively, then integers, then floats;
+    anything else stays a string. Ordinary strings are rejected by a regex
+    match instead of two failed conversions. Results are immutable, so
+    repeated references to the same value are classified once.
+    """
+    if len(text) <= 5:  # Longer text cannot spell a boolean; skip lower()
+        lowered = text.lower()
+        if lowered in _BOOLEAN_WORDS:
+            return "boolean", lowered == "true"
+    if _NUMBER_LIKE_RE.match(text):
+        # int() never accepts a fraction or exponent, so skip straight to float()
+        if "." not in text and "e" not in text and "E" not in text:
+            try:
+                return "integer", int(text)
+            except ValueError:
+                pass  # Try float conversion next
+        try:
+            return "float", float(text)
+        except ValueError:
+            pass  # Default to string type
+    return "string", text
+
+
+def _classify_number(text: str) -> Tuple[str, Any]:
+    """Convert NUMBER token text to its (type, value) pair.
+
+    A fraction or exponent marks a float; everything else is converted
+    with int() directly, so floats never pay for a failed int() first.
+
+    Raises:
+        ValueError: If the text is not a valid number
+    """
+    if "." in text or "e" in text or "E" in text:
+        return "float", float(text)
+    return "integer", int(text)
+
+
+def _namespace_chain_ends(types: Sequence[str]) -> List[int]:
+    """Map each position to the index just past the ``IDENT (:: IDENT)*`` run there.
+
+    Built right to left in one pass, so an identifier followed by ``::`` and
+    another identifier inherits the end of the chain that starts two tokens on.
+    Positions that do not start a chain map to the next index.
+    """
+    n = len(types)
+    ends = list(range(1, n + 1))
+    for i in range(n - 3, -1, -1):
+        if (
+            types[i] is T_IDENT
+            and types[i + 1] is T_NAMESPACE
+            and types[i + 2] is T_IDENT
+        ):
+            ends[i] = ends[i + 2]
+    return ends
 
 
-# REASONING: ConfigParseError enables parsing error handling and diagnostic reporting for error workflows.
-# Error workflows require config parse error for parsing error handling and diagnostic reporting in error workflows.
-# ConfigParseError supports parsing error handling, diagnostic reporting, and error coordination while enabling
-# comprehensive error strategies and systematic parsing error workflows.
 class ConfigParseError(Exception):
     """Exception raised when configuration parsing fails."""
 
-    # REASONING: Error constructor enables exception initialization and context preservation for error workflows.
-    # Error workflows require error constructor for exception initialization and context preservation in error workflows.
-    # Error constructor supports exception initialization, context preservation, and error coordination while enabling
-    # comprehensive error handling strategies and systematic exception management workflows.
     def __init__(
         self,
         message: str,
@@ -41,10 +215,6 @@ class ConfigParseError(Exception):
         self.expected = expected  # What was expected vs. what was found
         super().__init__(self._format_message())
 
-    # REASONING: Message formatting enables error presentation and debugging support for formatting workflows.
-    # Formatting workflows require message formatting for error presentation and debugging support in formatting workflows.
-    # Message formatting supports error presentation, debugging support, and formatting coordination while enabling
-    # comprehensive formatting strategies and systematic error presentation workflows.
     def _format_message(self) -> str:
         """Format the error message with line and column information if available."""
         location = []
@@ -58,34 +228,113 @@ class ConfigParseError(Exception):
         return f"{self.message}{loc_str}{context}"
 
 
-# REASONING: Parser class enables configuration parsing and syntax tree construction for parsing workflows.
-# Parsing workflows require parser class for configuration parsing and syntax tree construction in parsing workflows.
-# Parser class supports configuration parsing, syntax tree construction, and parsing coordination while enabling
-# comprehensive parser strategies and systematic parsing workflows.
+def _as_tokens(tokens: Sequence[Any]) -> Sequence[Token]:
+    """Return ``tokens`` as Token objects, converting lexer-style dicts once."""
+    if tokens and isinstance(tokens[0], dict):
+        return [Token(t["type"], t["value"], t["line"], t["col"]) for t in tokens]
+    return tokens
+
+
+# Tokens plus the parser's parallel type, value and cooked columns
+_TokenColumns = Tuple[
+    Tuple[Token, ...], Tuple[str, ...], Tuple[str, ...], Tuple[Optional[str], ...]
+]
+
+
+@lru_cache(maxsize=128)
+def _lex_columns(text: str) -> _TokenColumns:
+    """Lex ``text`` into Token objects and the parser columns in one pass.
+
+    The columns are tuples shared between parsers of the same text; parsers
+    only ever read them.
+    """
+    tokens = []
+    types = []
+    values = []
+    cooked = []
+    for token in lex(text):
+        token_type = token["type"]  # Already one of the interned T_* constants
+        value = token["value"]
+        tokens.append(Token(token_type, value, token["line"], token["col"]))
+        types.append(token_type)
+        values.append(value)
+        if token_type is T_STRING:
+            cooked.append(value[1:-1])  # Without quotes
+        elif token_type is T_ENV:
+            cooked.append(value[2:-1])  # Without ${ and }
+        else:
+            cooked.append(None)
+    return tuple(tokens), tuple(types), tuple(values), tuple(cooked)
+
+
+def _make_parser(
+    text: str, base_path: Path, included_files: Optional[Set[Path]]
+) -> "Parser":
+    """Create a Parser for ``text`` loaded from the cached token columns."""
+    parser = Parser((), text.splitlines(), base_path, included_files)
+    parser._load_tokens(*_lex_columns(text))
+    return parser
+
+
 class Parser:
     """Parser for CFG++ configuration files."""
 
-    # REASONING: Parser constructor enables parsing state initialization and context management for initialization workflows.
-    # Initialization workflows require parser constructor for parsing state initialization and context management in initialization workflows.
-    # Parser constructor supports parsing state initialization, context management, and initialization coordination while enabling
-    # comprehensive constructor strategies and systematic parsing initialization workflows.
     def __init__(
         self,
-        tokens: List[Dict[str, Any]],
+        tokens: Sequence[Any],
         source_lines: List[str],
         base_path: Optional[Path] = None,
         included_files: Optional[Set[Path]] = None,
     ):
-        self.tokens = tokens  # Tokenized input for parsing
         self.source_lines = source_lines  # Original source for error context
-        self.pos = 0  # Current token position
+        self.pos: int = 0  # Current token position
         self.base_path = base_path or Path.cwd()  # Base path for file resolution
-        self.included_files = included_files or set()  # Circular include prevention
+        # Circular include prevention; a caller's set is shared, not copied
+        self.included_files = included_files if included_files is not None else set()
+        self._include_deps: Dict[Path, Tuple[int, int]] = {}  # Files read via includes
+        # False once an include depends on the environment
+        self._include_cacheable = True
+        # Variable name -> value, None if unset
+        self._env_cache: Dict[str, Optional[str]] = {}
+        self._load_tokens(tokens)  # Tokenized input for parsing
+
+    def _load_tokens(
+        self,
+        tokens: Sequence[Any],
+        types: Optional[Sequence[str]] = None,
+        values: Optional[Sequence[str]] = None,
+        cooked: Optional[Sequence[Optional[str]]] = None,
+    ) -> None:
+        """Store the token stream along with parallel type, value and cooked columns.
+
+        ``cooked`` holds string literal contents without their quotes and
+        environment references without ``${``/``}`` (None for other tokens).
+        Callers that already built the columns (``_lex_columns``, ``_scan``) pass
+        them in to skip the extra pass over the tokens.
+        """
+        self.tokens = _as_tokens(tokens) or []
+        if types is None or values is None or cooked is None:
+            # Interned so predicates can compare with ``is`` against the T_* constants
+            types = [sys.intern(token.type) for token in self.tokens]
+            values = [token.value for token in self.tokens]  # Token text
+            unwrapped: List[Optional[str]] = []
+            for token_type, value in zip(types, values):
+                if token_type is T_STRING:
+                    unwrapped.append(value[1:-1])  # Without quotes
+                elif token_type is T_ENV:
+                    unwrapped.append(value[2:-1])  # Without ${ and }
+                else:
+                    unwrapped.append(None)
+            cooked = unwrapped
+        self.types = types
+        self.values = values
+        self.cooked = cooked
+        self._n = len(self.tokens)  # Cached stream length for bounds checks
+        # Most documents never use '::'; identifier parsing then skips the chain check
+        self._has_namespace = T_NAMESPACE in types
+        # Position -> end of the namespaced identifier starting there, if any '::'
+        self._chain_end = _namespace_chain_ends(types) if self._has_namespace else None
 
-    # REASONING: Parse method enables configuration processing and syntax tree construction for parsing workflows.
-    # Parsing workflows require parse method for configuration processing and syntax tree construction in parsing workflows.
-    # Parse method supports configuration processing, syntax tree construction, and parsing coordination while enabling
-    # comprehensive parsing strategies and systematic configuration processing workflows.
     def parse(self, text: Optional[str] = None) -> Dict:
         """Parse the given cfgpp configuration text into a Python dictionary.
 
@@ -98,682 +347,478 @@ class Parser:
         Raises:
             ValueError: If no tokens are provided and no text is given to parse
         """
-        # REASONING: Input validation and tokenization enable proper parsing setup and input preparation for setup workflows.
-        # Setup workflows require input validation and tokenization for proper parsing setup and input preparation in setup workflows.
-        # Input validation and tokenization support proper parsing setup, input preparation, and setup coordination while enabling
-        # comprehensive validation strategies and systematic setup workflows.
         if text is not None:
-            self.tokens = self._tokenize(text)
+            self._load_tokens(*self._scan(text))
         elif not self.tokens:
             raise ValueError("No tokens provided and no text to parse")
 
         self.pos = 0  # Reset parser position
 
-        # REASONING: Simple assignment detection enables basic configuration handling and key-value recognition for detection workflows.
-        # Detection workflows require simple assignment detection for basic configuration handling and key-value recognition in detection workflows.
-        # Simple assignment detection supports basic configuration handling, key-value recognition, and detection coordination while enabling
-        # comprehensive detection strategies and systematic assignment workflows.
-        if (
-            self._current_token()
-            and self._current_token()["type"] == "IDENTIFIER"
-            and self._current_token(1)
-            and self._current_token(1)["value"] == "="
-        ):
+        types = self.types  # Local bindings for the top-level loop
+        n = self._n
+        if n > 1 and types[0] is T_IDENT and self.values[1] == "=":
             # Parse as a simple key-value pair
             key, value = self._parse_key_value_pair()
             return {"body": {key: value}}
 
-        # REASONING: Multi-object parsing enables complex configuration processing and hierarchical structure handling for structure workflows.
-        # Structure workflows require multi-object parsing for complex configuration processing and hierarchical structure handling in structure workflows.
-        # Multi-object parsing supports complex configuration processing, hierarchical structure handling, and structure coordination while enabling
-        # comprehensive parsing strategies and systematic structure workflows.
         body = {}
-        while self._current_token():
-            # REASONING: Enum definition processing enables type definition and value constraint specification for enum workflows.
-            # Enum workflows require enum definition processing for type definition and value constraint specification in enum workflows.
-            # Enum definition processing supports type definition, value constraint specification, and enum coordination while enabling
-            # comprehensive enum strategies and systematic type workflows.
-            if self._current_token()["type"] == "ENUM":
-                enum_name, enum_data = self._parse_enum_definition()
-                body[enum_name] = enum_data
-            # REASONING: Include directive processing enables modular configuration and file composition for composition workflows.
-            # Composition workflows require include directive processing for modular configuration and file composition in composition workflows.
-            # Include directive processing supports modular configuration, file composition, and composition coordination while enabling
-            # comprehensive include strategies and systematic composition workflows.
-            elif self._current_token()["type"] == "INCLUDE":
-                include_token = self._consume("INCLUDE")
-
-                # REASONING: Path validation enables file reference checking and include safety for validation workflows.
-                # Validation workflows require path validation for file reference checking and include safety in validation workflows.
-                # Path validation supports file reference checking, include safety, and validation coordination while enabling
-                # comprehensive validation strategies and systematic include workflows.
-                if (
-                    not self._current_token()
-                    or self._current_token()["type"] != "STRING"
-                ):
-                    raise self._create_syntax_error(
-                        "Expected string path after include directive",
-                        self._current_token(),
-                        "string path",
-                    )
-
-                path_token = self._consume("STRING")
-                include_path = path_token["value"][1:-1]  # Remove quotes
-
-                # REASONING: Include processing and merging enable file composition and configuration integration for integration workflows.
-                # Integration workflows require include processing and merging for file composition and configuration integration in integration workflows.
-                # Include processing and merging support file composition, configuration integration, and integration coordination while enabling
-                # comprehensive processing strategies and systematic integration workflows.
-                included_data = self._process_include(include_path)
-
-                # Merge included data into the current body
-                if "body" in included_data:
-                    for include_key, include_value in included_data["body"].items():
-                        body[include_key] = include_value
-
-            elif self._current_token()["type"] == "IDENTIFIER":
-                # REASONING: Object parsing enables configuration object processing and structured data handling for object workflows.
-                # Object workflows require object parsing for configuration object processing and structured data handling in object workflows.
-                # Object parsing supports configuration object processing, structured data handling, and object coordination while enabling
-                # comprehensive parsing strategies and systematic object workflows.
-                obj = self._parse_object(is_top_level=True)
-                if "body" in obj:
-                    # Merge all objects from the parsed result
-                    for obj_key, obj_value in obj["body"].items():
-                        body[obj_key] = obj_value
-                else:
-                    # REASONING: Single object handling enables individual configuration processing and object integration for object workflows.
-                    # Object workflows require single object handling for individual configuration processing and object integration in object workflows.
-                    # Single object handling supports individual configuration processing, object integration, and object coordination while enabling
-                    # comprehensive handling strategies and systematic object workflows.
-                    if "name" in obj:
-                        body[obj["name"]] = obj
-                    else:
-                        # Use a generated key if no name
-                        body[f"object_{len(body)}"] = obj
-            else:
-                # REASONING: Error handling enables invalid syntax detection and parsing failure reporting for error workflows.
-                # Error workflows require error handling for invalid syntax detection and parsing failure reporting in error workflows.
-                # Error handling supports invalid syntax detection, parsing failure reporting, and error coordination while enabling
-                # comprehensive error strategies and systematic parsing error workflows.
+        dispatch = _TOP_LEVEL_HANDLERS
+        while self.pos < n:  # Handlers advance self.pos
+            token_type = types[self.pos]
+            handler = dispatch.get(token_type)
+            if handler is None:
                 raise self._create_syntax_error(
-                    f"Unexpected token at top level: {self._current_token()['type']} '{self._current_token()['value']}'",
+                    f"Unexpected token at top level: {token_type} '{self._value()}'",
                     self._current_token(),
                     "object name or include directive",
                 )
+            handler(self, body)
 
-        # REASONING: Result construction enables parsed data structure creation and output preparation for construction workflows.
-        # Construction workflows require result construction for parsed data structure creation and output preparation in construction workflows.
-        # Result construction supports parsed data structure creation, output preparation, and construction coordination while enabling
-        # comprehensive construction strategies and systematic result workflows.
         return {"body": body}
 
-    # REASONING: Tokenize method enables text to token conversion and lexical analysis for tokenization workflows.
-    # Tokenization workflows require tokenize method for text to token conversion and lexical analysis in tokenization workflows.
-    # Tokenize method supports text to token conversion, lexical analysis, and tokenization coordination while enabling
-    # comprehensive tokenization strategies and systematic lexical workflows.
-    def _tokenize(self, text: str) -> List[Dict]:
+    def _parse_enum_top(self, body: Dict[str, Any]) -> None:
+        """Parse a top-level enum definition into ``body``."""
+        enum_name, enum_data = self._parse_enum_definition()
+        body[enum_name] = enum_data
+
+    def _parse_include_top(self, body: Dict[str, Any]) -> None:
+        """Parse a top-level include directive and merge its objects into ``body``."""
+        self._advance()
+
+        if self._type() is not T_STRING:
+            raise self._create_syntax_error(
+                "Expected string path after include directive",
+                self._current_token(),
+                "string path",
+            )
+
+        include_path = self.cooked[self.pos]  # Unquoted at load time
+        self._advance()
+
+        included_data = self._process_include(include_path)
+
+        # Merge included data into the current body
+        if "body" in included_data:
+            body.update(included_data["body"])
+
+    def _parse_object_top(self, body: Dict[str, Any]) -> None:
+        """Parse a top-level object and merge it into ``body``."""
+        obj = self._parse_object()
+        pos = self.pos
+        if pos >= self._n or self.values[pos] not in _END_TOKENS:
+            body[obj["name"]] = obj
+        else:
+            body.update(obj["body"])  # Followed by ',', ';' or '=': merge its members
+
+    def _tokenize(self, text: str) -> List[Token]:
         """Convert the input text into a list of tokens."""
-        # REASONING: Token patterns enable syntax recognition and lexical element identification for pattern workflows.
-        # Pattern workflows require token patterns for syntax recognition and lexical element identification in pattern workflows.
-        # Token patterns support syntax recognition, lexical element identification, and pattern coordination while enabling
-        # comprehensive pattern strategies and systematic recognition workflows.
-        token_spec = [
-            ("COMMENT", r"//.*?$"),  # Single-line comments
-            ("STRING", r'"(?:\\.|[^"\\])*"'),  # Quoted strings with escape support
-            ("NUMBER", r"\d+(\.\d+)?"),  # Integer and floating-point numbers
-            ("BOOLEAN", r"true|false"),  # Boolean literals
-            ("NAMESPACE", r"::"),  # Namespace operator
-            ("IDENTIFIER", r"[a-zA-Z_]\w*"),  # Variable names and identifiers
-            ("PUNCTUATION", r"[\{\}\(\)\[\],;=]"),  # Structural punctuation
-            ("WHITESPACE", r"\s+"),  # Whitespace for formatting
-            ("NEWLINE", r"\n"),  # Line breaks for tracking
-            ("OTHER", r"."),  # Catch-all for unrecognized characters
-        ]
-
-        # REASONING: Regex compilation enables pattern matching optimization and parsing performance for compilation workflows.
-        # Compilation workflows require regex compilation for pattern matching optimization and parsing performance in compilation workflows.
-        # Regex compilation supports pattern matching optimization, parsing performance, and compilation coordination while enabling
-        # comprehensive compilation strategies and systematic optimization workflows.
-        token_regex = "|".join(f"(?P<{name}>{pattern})" for name, pattern in token_spec)
-
-        # REASONING: Token collection and position tracking enable parsing state management and location awareness for tracking workflows.
-        # Tracking workflows require token collection and position tracking for parsing state management and location awareness in tracking workflows.
-        # Token collection and position tracking support parsing state management, location awareness, and tracking coordination while enabling
-        # comprehensive collection strategies and systematic tracking workflows.
+        return self._scan(text)[0]
+
+    def _scan(
+        self, text: str
+    ) -> Tuple[List[Token], List[str], List[str], List[Optional[str]]]:
+        """Tokenize ``text`` and build the parallel parser columns in the same pass."""
         tokens = []
+        types: List[str] = []  # Interned token types, parallel to tokens
+        values: List[str] = []  # Token text, parallel to tokens
+        cooked: List[Optional[str]] = []  # Unquoted string contents, parallel to tokens
+        append = tokens.append  # Bound once for the hot loop
+        append_type = types.append
+        append_value = values.append
+        append_cooked = cooked.append
+        count_breaks = text.count  # Method and global lookups hoisted out of the loop
+        index_types = _INDEX_TYPES
+        make_token = Token
+        intern = sys.intern
         line_num = 1  # Current line for error reporting
         line_start = 0  # Line start position for column calculation
-
-        # REASONING: Pattern matching iteration enables token recognition and syntax element extraction for extraction workflows.
-        # Extraction workflows require pattern matching iteration for token recognition and syntax element extraction in extraction workflows.
-        # Pattern matching iteration supports token recognition, syntax element extraction, and extraction coordination while enabling
-        # comprehensive matching strategies and systematic extraction workflows.
-        for mo in re.finditer(token_regex, text, re.MULTILINE | re.DOTALL):
-            kind = mo.lastgroup  # Token type from named group
-            value = mo.group()  # Matched text content
-            column = mo.start() - line_start  # Column position
-
-            # REASONING: Special token handling enables formatting preservation and parsing state management for handling workflows.
-            # Handling workflows require special token handling for formatting preservation and parsing state management in handling workflows.
-            # Special token handling supports formatting preservation, parsing state management, and handling coordination while enabling
-            # comprehensive handling strategies and systematic state workflows.
-            if kind == "NEWLINE":
-                line_start = mo.end()  # Update line start position
-                line_num += 1  # Increment line counter
-                continue
-            elif kind == "WHITESPACE":
-                continue  # Skip whitespace tokens
-            elif kind == "COMMENT":
-                continue  # Skip comment tokens
-            elif kind == "OTHER":
-                # REASONING: Error reporting enables invalid character detection and parsing failure indication for error workflows.
-                # Error workflows require error reporting for invalid character detection and parsing failure indication in error workflows.
-                # Error reporting supports invalid character detection, parsing failure indication, and error coordination while enabling
-                # comprehensive error strategies and systematic parsing error workflows.
-                raise SyntaxError(
-                    f"Unexpected character: {value} at line {line_num}, column {column + 1}"
-                )
-
-            # REASONING: Token creation enables lexical unit construction and parser input preparation for creation workflows.
-            # Creation workflows require token creation for lexical unit construction and parser input preparation in creation workflows.
-            # Token creation supports lexical unit construction, parser input preparation, and creation coordination while enabling
-            # comprehensive creation strategies and systematic token workflows.
-            tokens.append(
-                {
-                    "type": kind,  # Token category
-                    "value": value,  # Matched text
-                    "line": line_num,  # Line number for errors
-                    "col": column + 1,  # Column position (1-based)
-                }
+        counted = 0  # Position up to which line breaks have been counted
+        last_end = 0  # End of the previous match; a gap means an unmatched character
+
+        for mo in _TOKEN_RE.finditer(text):
+            if mo.start() != last_end:
+                break  # Skipped text that no pattern matched
+            group = mo.lastindex
+            token_type = index_types[group]  # Token type from group number
+
+            if token_type is None:
+                last_end = mo.start(group)
+                break  # End of input, or the first character no token matches
+            start, last_end = mo.span(group)  # Token span, after any skipped text
+
+            breaks = count_breaks("\n", counted, start)
+            if breaks:
+                line_num += breaks
+                line_start = text.rfind("\n", counted, start) + 1
+            counted = start
+            value = mo.group(group)  # Matched text content
+            column = start - line_start + 1  # 1-based column
+
+            if token_type is T_IDENT:
+                if value == "true" or value == "false":
+                    token_type = T_BOOL  # Keywords share the identifier pattern
+                else:
+                    value = intern(value)  # One shared string per identifier name
+            append(make_token(token_type, value, line_num, column))
+            append_type(token_type)
+            append_value(value)
+            append_cooked(value[1:-1] if token_type is T_STRING else None)
+
+        if last_end != len(text):
+            # Point at the bad character
+            last_end = _SKIP_RE.match(text, last_end).end()
+            breaks = text.count("\n", counted, last_end)
+            if breaks:
+                line_num += breaks
+                line_start = text.rfind("\n", counted, last_end) + 1
+            column = last_end - line_start + 1
+            raise SyntaxError(
+                f"Unexpected character: {text[last_end]} "
+                f"at line {line_num}, column {column}"
             )
 
-        # REASONING: Token return enables parser input provision and lexical analysis completion for return workflows.
-        # Return workflows require token return for parser input provision and lexical analysis completion in return workflows.
-        # Token return supports parser input provision, lexical analysis completion, and return coordination while enabling
-        # comprehensive return strategies and systematic token workflows.
-        return tokens
+        return tokens, types, values, cooked
 
-    # REASONING: Current token method enables parsing state access and token inspection for access workflows.
-    # Access workflows require current token method for parsing state access and token inspection in access workflows.
-    # Current token method supports parsing state access, token inspection, and access coordination while enabling
-    # comprehensive access strategies and systematic parsing workflows.
-    def _current_token(self, offset: int = 0) -> Optional[Dict]:
-        """Get the current token with an optional offset.
+    def _current_token(self, offset: int = 0) -> Optional[Token]:
+        """Get the current token with an optional lookahead offset.
+
+        Offsets are non-negative and ``self.pos`` never drops below zero, so
+        only the cached stream length ``self._n`` needs checking.
 
         Returns:
             The token at the current position + offset, or None if beyond the end
         """
-        # REASONING: Position calculation and bounds checking enable safe token access and parsing state management for access workflows.
-        # Access workflows require position calculation and bounds checking for safe token access and parsing state management in access workflows.
-        # Position calculation and bounds checking support safe token access, parsing state management, and access coordination while enabling
-        # comprehensive calculation strategies and systematic access workflows.
         pos = self.pos + offset
-        if 0 <= pos < len(self.tokens):
+        if pos < self._n:
             return self.tokens[pos]
         return None
 
-    # REASONING: Syntax error creation enables parsing error construction and diagnostic information for error workflows.
-    # Error workflows require syntax error creation for parsing error construction and diagnostic information in error workflows.
-    # Syntax error creation supports parsing error construction, diagnostic information, and error coordination while enabling
-    # comprehensive error strategies and systematic diagnostic workflows.
+    def _type(self, offset: int = 0) -> Optional[str]:
+        """Get the type of the token at the current position + offset, or None."""
+        pos = self.pos + offset
+        return self.types[pos] if pos < self._n else None
+
+    def _value(self, offset: int = 0) -> Optional[str]:
+        """Get the value of the token at the current position + offset, or None."""
+        pos = self.pos + offset
+        return self.values[pos] if pos < self._n else None
+
+    def _resolve_env(self, content: str, token: Token) -> Tuple[str, str]:
+        """Resolve the ``VAR`` or ``VAR:-default`` inside ``${...}`` to (name, value).
+
+        Each name is read from the environment once per parse, and included
+        files share the cache, so every reference sees the same value even if
+        the environment changes while parsing. The default is only extracted
+        when the variable is unset.
+        """
+        split = content.find(":-")
+        var_name = content if split < 0 else content[:split]
+
+        cache = self._env_cache
+        if var_name in cache:
+            env_value = cache[var_name]
+        else:
+            env_value = cache[var_name] = os.environ.get(var_name)
+
+        if env_value is None:
+            if split < 0:
+                raise self._create_syntax_error(
+                    f"Environment variable '{var_name}' is not set and no default provided",
+                    token,
+                )
+            env_value = content[split + 2 :]
+            if env_value.startswith('"') and env_value.endswith('"'):
+                env_value = env_value[1:-1]  # Remove quotes from default
+        return var_name, env_value
+
     def _create_syntax_error(
-        self, message: str, token: Optional[Dict] = None, expected: Optional[str] = None
+        self,
+        message: str,
+        token: Optional[Token] = None,
+        expected: Optional[str] = None,
     ) -> ConfigParseError:
         """Create a syntax error with detailed context information."""
-        return ConfigParseError(message, token, expected)
+        if token is None:
+            return ConfigParseError(message, expected=expected)
+        return ConfigParseError(message, token.line, token.column, expected=expected)
 
-    # REASONING: Include processing enables modular configuration and file composition for composition workflows.
-    # Composition workflows require include processing for modular configuration and file composition in composition workflows.
-    # Include processing supports modular configuration, file composition, and composition coordination while enabling
-    # comprehensive processing strategies and systematic composition workflows.
     def _process_include(self, include_path: str) -> Dict[str, Any]:
         """Process an include/import directive."""
-        # REASONING: Path resolution enables file location and extension normalization for resolution workflows.
-        # Resolution workflows require path resolution for file location and extension normalization in resolution workflows.
-        # Path resolution supports file location, extension normalization, and resolution coordination while enabling
-        # comprehensive resolution strategies and systematic file workflows.
         if not include_path.endswith(".cfgpp"):
             include_path += ".cfgpp"  # Add default extension
 
         resolved_path = (self.base_path / include_path).resolve()
 
-        # REASONING: Circular include detection enables infinite recursion prevention and safety assurance for safety workflows.
-        # Safety workflows require circular include detection for infinite recursion prevention and safety assurance in safety workflows.
-        # Circular include detection supports infinite recursion prevention, safety assurance, and safety coordination while enabling
-        # comprehensive detection strategies and systematic safety workflows.
         if resolved_path in self.included_files:
             raise ConfigParseError(f"Circular include detected: {include_path}")
 
-        # REASONING: File existence validation enables include safety and error prevention for validation workflows.
-        # Validation workflows require file existence validation for include safety and error prevention in validation workflows.
-        # File existence validation supports include safety, error prevention, and validation coordination while enabling
-        # comprehensive validation strategies and systematic include workflows.
-        if not resolved_path.exists():
-            raise ConfigParseError(f"Include file not found: {include_path}")
+        cached = _INCLUDE_CACHE.get(resolved_path)
+        if cached is not None:
+            cached_result, deps = cached
+            try:
+                fresh = all(_file_signature(dep) == sig for dep, sig in deps.items())
+            except OSError:
+                fresh = False
+            # A cached file that reaches an ancestor must re-parse to report the cycle
+            if fresh and self.included_files.isdisjoint(deps):
+                _cache_include(resolved_path, cached)
+                self._include_deps.update(deps)
+                return _copy_tree(cached_result)
 
-        # REASONING: File reading and error handling enable content loading and failure management for loading workflows.
-        # Loading workflows require file reading and error handling for content loading and failure management in loading workflows.
-        # File reading and error handling support content loading, failure management, and loading coordination while enabling
-        # comprehensive reading strategies and systematic loading workflows.
         try:
+            signature = _file_signature(resolved_path)  # Taken before reading
             with open(resolved_path, "r", encoding="utf-8") as f:
                 included_content = f.read()
+        except FileNotFoundError:
+            raise ConfigParseError(f"Include file not found: {include_path}")
         except IOError as e:
             raise ConfigParseError(f"Failed to read include file '{include_path}': {e}")
 
-        # REASONING: Recursive parsing enables nested configuration processing and composition support for recursion workflows.
-        # Recursion workflows require recursive parsing for nested configuration processing and composition support in recursion workflows.
-        # Recursive parsing supports nested configuration processing, composition support, and recursion coordination while enabling
-        # comprehensive parsing strategies and systematic recursion workflows.
-        new_included_files = self.included_files.copy()  # Track included files
-        new_included_files.add(resolved_path)
+        # The include chain is shared with nested parsers: includes are parsed
+        # depth-first, so it only ever holds the current branch
+        self.included_files.add(resolved_path)
+        try:
+            parser = _make_parser(
+                included_content, resolved_path.parent, self.included_files
+            )
+            parser._env_cache = self._env_cache  # One environment snapshot per parse
+            result = _run_parser(parser)
+        finally:
+            self.included_files.discard(resolved_path)
 
-        return loads(included_content, str(resolved_path.parent), new_included_files)
+        deps = {resolved_path: signature, **parser._include_deps}
+        self._include_deps.update(deps)
+        if "${" in included_content or not parser._include_cacheable:
+            # Environment lookups happen at parse time, so the result is not reusable
+            self._include_cacheable = False
+        else:
+            _cache_include(resolved_path, (_copy_tree(result), deps))
+        return result
 
-    # REASONING: Expression detection enables mathematical expression recognition and parsing preparation for detection workflows.
-    # Detection workflows require expression detection for mathematical expression recognition and parsing preparation in detection workflows.
-    # Expression detection supports mathematical expression recognition, parsing preparation, and detection coordination while enabling
-    # comprehensive detection strategies and systematic expression workflows.
     def _is_expression_start(self) -> bool:
         """Check if the current position starts an expression by looking ahead for operators."""
-        # REASONING: Position preservation enables lookahead analysis and state restoration for preservation workflows.
-        # Preservation workflows require position preservation for lookahead analysis and state restoration in preservation workflows.
-        # Position preservation supports lookahead analysis, state restoration, and preservation coordination while enabling
-        # comprehensive preservation strategies and systematic lookahead workflows.
-        original_pos = self.pos
+        types = self.types  # Local bindings avoid per-access method calls
+        values = self.values
+        n = self._n
+        pos = self.pos
 
-        try:
-            # REASONING: Token validation enables expression checking and input verification for validation workflows.
-            # Validation workflows require token validation for expression checking and input verification in validation workflows.
-            # Token validation supports expression checking, input verification, and validation coordination while enabling
-            # comprehensive validation strategies and systematic expression workflows.
-            if not self._current_token():
-                return False
-
-            # REASONING: Parenthesis detection enables grouped expression recognition and precedence handling for grouping workflows.
-            # Grouping workflows require parenthesis detection for grouped expression recognition and precedence handling in grouping workflows.
-            # Parenthesis detection supports grouped expression recognition, precedence handling, and grouping coordination while enabling
-            # comprehensive detection strategies and systematic grouping workflows.
-            if self._current_token()["value"] == "(":
-                return True
-
-            # REASONING: Literal and operator checking enables expression pattern recognition and mathematical operation detection for pattern workflows.
-            # Pattern workflows require literal and operator checking for expression pattern recognition and mathematical operation detection in pattern workflows.
-            # Literal and operator checking supports expression pattern recognition, mathematical operation detection, and pattern coordination while enabling
-            # comprehensive checking strategies and systematic pattern workflows.
-            if self._current_token()["type"] in [
-                "STRING",
-                "NUMBER",
-                "BOOLEAN",
-                "ENV_VAR",
-                "IDENTIFIER",
-            ]:
-                self.pos += 1
-                # Check for following operators
-                if (
-                    self._current_token()
-                    and self._current_token()["type"] == "OPERATOR"
-                    and self._current_token()["value"] in ["+", "-", "*", "/"]
-                ):
-                    return True
+        if pos >= n:
+            return False
+
+        if values[pos] == "(":
+            return True
 
+        if types[pos] not in _EXPR_STARTERS:
             return False
-        finally:
-            # REASONING: State restoration enables parsing position recovery and consistent state management for restoration workflows.
-            # Restoration workflows require state restoration for parsing position recovery and consistent state management in restoration workflows.
-            # State restoration supports parsing position recovery, consistent state management, and restoration coordination while enabling
-            # comprehensive restoration strategies and systematic state workflows.
-            self.pos = original_pos
-
-    # REASONING: Expression parsing enables mathematical expression processing and calculation support for expression workflows.
-    # Expression workflows require expression parsing for mathematical expression processing and calculation support in expression workflows.
-    # Expression parsing supports mathematical expression processing, calculation support, and expression coordination while enabling
-    # comprehensive parsing strategies and systematic expression workflows.
-    def _parse_expression(self) -> Dict[str, Any]:
-        """Parse a mathematical or string expression."""
-        return self._parse_addition()
-
-    # REASONING: Addition parsing enables arithmetic operation processing and precedence handling for arithmetic workflows.
-    # Arithmetic workflows require addition parsing for arithmetic operation processing and precedence handling in arithmetic workflows.
-    # Addition parsing supports arithmetic operation processing, precedence handling, and arithmetic coordination while enabling
-    # comprehensive parsing strategies and systematic arithmetic workflows.
-    def _parse_addition(self) -> Dict[str, Any]:
-        """Parse addition and subtraction operations."""
-        left = self._parse_multiplication()  # Higher precedence first
-
-        # REASONING: Operator iteration enables left-associative expression evaluation and operation chaining for iteration workflows.
-        # Iteration workflows require operator iteration for left-associative expression evaluation and operation chaining in iteration workflows.
-        # Operator iteration supports left-associative expression evaluation, operation chaining, and iteration coordination while enabling
-        # comprehensive iteration strategies and systematic evaluation workflows.
-        while (
-            self._current_token()
-            and self._current_token()["type"] == "OPERATOR"
-            and self._current_token()["value"] in ["+", "-"]
-        ):
-            op_token = self._consume("OPERATOR")
-            right = self._parse_multiplication()
-
-            # REASONING: Binary operation evaluation enables arithmetic calculation and result computation for evaluation workflows.
-            # Evaluation workflows require binary operation evaluation for arithmetic calculation and result computation in evaluation workflows.
-            # Binary operation evaluation supports arithmetic calculation, result computation, and evaluation coordination while enabling
-            # comprehensive evaluation strategies and systematic calculation workflows.
-            left = self._evaluate_binary_op(left, op_token["value"], right)
-
-        return left
-
-    # REASONING: Multiplication parsing enables high-precedence arithmetic and mathematical operation processing for multiplication workflows.
-    # Multiplication workflows require multiplication parsing for high-precedence arithmetic and mathematical operation processing in multiplication workflows.
-    # Multiplication parsing supports high-precedence arithmetic, mathematical operation processing, and multiplication coordination while enabling
-    # comprehensive parsing strategies and systematic multiplication workflows.
-    def _parse_multiplication(self) -> Dict[str, Any]:
-        """Parse multiplication and division operations."""
-        left = self._parse_primary()  # Highest precedence
-
-        # REASONING: High-precedence operator processing enables mathematical operation precedence and calculation order for precedence workflows.
-        # Precedence workflows require high-precedence operator processing for mathematical operation precedence and calculation order in precedence workflows.
-        # High-precedence operator processing supports mathematical operation precedence, calculation order, and precedence coordination while enabling
-        # comprehensive processing strategies and systematic precedence workflows.
-        while (
-            self._current_token()
-            and self._current_token()["type"] == "OPERATOR"
-            and self._current_token()["value"] in ["*", "/"]
-        ):
-            op_token = self._consume("OPERATOR")
-            right = self._parse_primary()
 
-            # REASONING: Multiplication evaluation enables arithmetic calculation and numerical result computation for computation workflows.
-            # Computation workflows require multiplication evaluation for arithmetic calculation and numerical result computation in computation workflows.
-            # Multiplication evaluation supports arithmetic calculation, numerical result computation, and computation coordination while enabling
-            # comprehensive evaluation strategies and systematic computation workflows.
-            left = self._evaluate_binary_op(left, op_token["value"], right)
+        pos += 1
+        return pos < n and types[pos] is T_OPERATOR and values[pos] in _ARITH_OPS
 
-        return left
+    def _parse_expression(
+        self, first: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Parse a mathematical or string expression.
 
-    # REASONING: Primary parsing enables fundamental expression element processing and literal value handling for primary workflows.
-    # Primary workflows require primary parsing for fundamental expression element processing and literal value handling in primary workflows.
-    # Primary parsing supports fundamental expression element processing, literal value handling, and primary coordination while enabling
-    # comprehensive parsing strategies and systematic primary workflows.
-    def _parse_primary(self) -> Dict[str, Any]:
-        """Parse primary expressions (numbers, strings, parenthesized expressions)."""
-        # REASONING: Token validation enables expression input checking and parsing safety for validation workflows.
-        # Validation workflows require token validation for expression input checking and parsing safety in validation workflows.
-        # Token validation supports expression input checking, parsing safety, and validation coordination while enabling
-        # comprehensive validation strategies and systematic primary workflows.
-        token = self._current_token()
+        Operators are resolved with an explicit operand/operator stack
+        (shunting-yard), so long operator chains cost no extra Python frames.
+        Parenthesized groups recurse through ``_parse_primary``.
 
-        if not token:
-            raise self._create_syntax_error("Unexpected end of input in expression")
+        Args:
+            first: Already-parsed left operand to continue from, if any
+        """
+        operands = [first if first is not None else self._parse_primary()]
+        operators: List[str] = []
+        concat: Optional[List[str]] = None  # Pieces of a string pending in operands[0]
+        evaluate = self._evaluate_binary_op
+        types = self.types
+        values = self.values
+        n = self._n
 
-        # REASONING: Parenthesized expression handling enables precedence override and grouped evaluation for grouping workflows.
-        # Grouping workflows require parenthesized expression handling for precedence override and grouped evaluation in grouping workflows.
-        # Parenthesized expression handling supports precedence override, grouped evaluation, and grouping coordination while enabling
-        # comprehensive handling strategies and systematic grouping workflows.
-        if token["value"] == "(":
-            self._consume("PUNCTUATION", "(")
-            result = self._parse_expression()  # Recursive expression parsing
-            if not self._current_token() or self._current_token()["value"] != ")":
-                raise self._create_syntax_error(
-                    "Expected ')' to close expression", self._current_token(), "')'"
-                )
-            self._consume("PUNCTUATION", ")")
-            return result
-
-        # REASONING: String literal processing enables text value extraction and quote removal for text workflows.
-        # Text workflows require string literal processing for text value extraction and quote removal in text workflows.
-        # String literal processing supports text value extraction, quote removal, and text coordination while enabling
-        # comprehensive processing strategies and systematic text workflows.
-        if token["type"] == "STRING":
-            value = self._consume("STRING")["value"]
-            value = value[1:-1]  # Remove surrounding quotes
-            return {
-                "type": "string",
-                "value": value,
-                "line": token["line"],
-                "col": token["col"],
-            }
+        try:
+            while True:
+                prec = 0  # End of expression; reduces everything left on the stack
+                if self.pos < n and types[self.pos] is T_OPERATOR:
+                    prec = _BINARY_PREC.get(values[self.pos], 0)
+
+                while operators and _BINARY_PREC[operators[-1]] >= prec:
+                    operator = operators.pop()
+                    right = operands.pop()
+
+                    # "+" has the lowest precedence, so its left operand is always
+                    # operands[0]; a string there keeps absorbing "+" operands
+                    if len(operands) == 1:
+                        if concat is not None:
+                            if operator == "+":
+                                concat.append(str(right["value"]))
+                                continue
+                            operands[0]["value"] = "".join(concat)
+                            concat = None
+                        result = evaluate(operands[0], operator, right)
+                        if operator == "+" and result["type"] == "string":
+                            concat = [result["value"]]
+                    else:
+                        result = evaluate(operands[-1], operator, right)
+                    operands[-1] = result
 
-        # REASONING: Number parsing enables numeric value processing and type determination for numeric workflows.
-        # Numeric workflows require number parsing for numeric value processing and type determination in numeric workflows.
-        # Number parsing supports numeric value processing, type determination, and numeric coordination while enabling
-        # comprehensive parsing strategies and systematic numeric workflows.
-        elif token["type"] == "NUMBER":
-            value = self._consume("NUMBER")["value"]
-            try:
-                value = int(value)  # Try integer first
-                value_type = "integer"
-            except ValueError:
-                try:
-                    value = float(value)  # Fall back to float
-                    value_type = "float"
-                except ValueError:
-                    raise self._create_syntax_error("Invalid number format", token)
-            return {
-                "type": value_type,
-                "value": value,
-                "line": token["line"],
-                "col": token["col"],
-            }
+                if not prec:
+                    break  # No further arithmetic operator; the caller takes the rest
+                operators.append(values[self.pos])
+                self.pos += 1
+                operands.append(self._parse_primary())
+        except OverflowError as e:  # Integer operand too large to convert to float
+            raise self._create_syntax_error(f"Error in expression evaluation: {e}")
 
-        # REASONING: Boolean parsing enables logical value processing and true/false determination for boolean workflows.
-        # Boolean workflows require boolean parsing for logical value processing and true/false determination in boolean workflows.
-        # Boolean parsing supports logical value processing, true/false determination, and boolean coordination while enabling
-        # comprehensive parsing strategies and systematic boolean workflows.
-        elif token["type"] == "BOOLEAN":
-            value = self._consume("BOOLEAN")["value"]
-            return {
-                "type": "boolean",
-                "value": value.lower() == "true",  # Convert to boolean
-                "line": token["line"],
-                "col": token["col"],
-            }
+        if concat is not None:
+            operands[0]["value"] = "".join(concat)
+        return operands[0]
 
-        # REASONING: Environment variable processing enables dynamic configuration and runtime substitution for substitution workflows.
-        # Substitution workflows require environment variable processing for dynamic configuration and runtime substitution in substitution workflows.
-        # Environment variable processing supports dynamic configuration, runtime substitution, and substitution coordination while enabling
-        # comprehensive processing strategies and systematic substitution workflows.
-        elif token["type"] == "ENV_VAR":
-            env_token = self._consume("ENV_VAR")["value"]
-            env_content = env_token[2:-1]  # Remove ${ and } delimiters
-
-            # REASONING: Default value handling enables fallback configuration and missing variable support for fallback workflows.
-            # Fallback workflows require default value handling for fallback configuration and missing variable support in fallback workflows.
-            # Default value handling supports fallback configuration, missing variable support, and fallback coordination while enabling
-            # comprehensive handling strategies and systematic fallback workflows.
-            if ":-" in env_content:
-                var_name, default_value = env_content.split(":-", 1)
-                if default_value.startswith('"') and default_value.endswith('"'):
-                    default_value = default_value[1:-1]  # Remove quotes from default
-            else:
-                var_name = env_content
-                default_value = None
-
-            # REASONING: Environment resolution enables system variable access and configuration externalization for resolution workflows.
-            # Resolution workflows require environment resolution for system variable access and configuration externalization in resolution workflows.
-            # Environment resolution supports system variable access, configuration externalization, and resolution coordination while enabling
-            # comprehensive resolution strategies and systematic environment workflows.
-            env_value = os.getenv(var_name, default_value)
-            if env_value is None:
-                raise self._create_syntax_error(
-                    f"Environment variable '{var_name}' is not set and no default provided",
-                    token,
-                )
+    def _parse_primary(self) -> Dict[str, Any]:
+        """Parse primary expressions (numbers, strings, parenthesized expressions)."""
+        pos = self.pos
+        if pos >= self._n:
+            raise self._create_syntax_error("Unexpected end of input in expression")
+        token = self.tokens[pos]
+
+        if token.value == "(":
+            values = self.values
+            n = self._n
+            depth = 0
+            while pos < n and values[pos] == "(":  # Open directly nested groups at once
+                depth += 1
+                pos += 1
+            self.pos = pos
+            result = self._parse_expression()  # Innermost group
+            while True:
+                pos = self.pos
+                if pos >= n or values[pos] != ")":
+                    raise self._create_syntax_error(
+                        "Expected ')' to close expression", self._current_token(), "')'"
+                    )
+                self.pos = pos + 1
+                depth -= 1
+                if not depth:
+                    return result
+                result = self._parse_expression(result)  # Rest of the enclosing group
 
-            # REASONING: Type inference enables automatic type detection and value conversion for inference workflows.
-            # Inference workflows require type inference for automatic type detection and value conversion in inference workflows.
-            # Type inference supports automatic type detection, value conversion, and inference coordination while enabling
-            # comprehensive inference strategies and systematic type workflows.
-            if env_value.lower() in ("true", "false"):
-                return {
-                    "type": "boolean",
-                    "value": env_value.lower() == "true",
-                    "line": token["line"],
-                    "col": token["col"],
-                    "env_var": var_name,
-                }
+        handler = _PRIMARY_HANDLERS.get(token.type)
+        if handler is not None:
+            return handler(self, token)
 
-            # REASONING: Integer conversion enables numeric type detection and value parsing for conversion workflows.
-            # Conversion workflows require integer conversion for numeric type detection and value parsing in conversion workflows.
-            # Integer conversion supports numeric type detection, value parsing, and conversion coordination while enabling
-            # comprehensive conversion strategies and systematic numeric workflows.
-            try:
-                int_value = int(env_value)
-                return {
-                    "type": "integer",
-                    "value": int_value,
-                    "line": token["line"],
-                    "col": token["col"],
-                    "env_var": var_name,
-                }
-            except ValueError:
-                pass  # Continue to float or string handling
+        raise self._create_syntax_error(
+            f"Unexpected token in expression: {token.value}", token
+        )
 
-            # REASONING: Float conversion enables floating-point type detection and decimal number support for float workflows.
-            # Float workflows require float conversion for floating-point type detection and decimal number support in float workflows.
-            # Float conversion supports floating-point type detection, decimal number support, and float coordination while enabling
-            # comprehensive conversion strategies and systematic float workflows.
-            try:
-                float_value = float(env_value)
-                return {
-                    "type": "float",
-                    "value": float_value,
-                    "line": token["line"],
-                    "col": token["col"],
-                    "env_var": var_name,
-                }
-            except ValueError:
-                pass  # Fall back to string type
+    def _primary_string(self, token: Token) -> Dict[str, Any]:
+        """Parse a string literal operand."""
+        value = self.cooked[self.pos]  # Unquoted at load time
+        self.pos += 1
+        return {
+            "type": "string",
+            "value": value,
+            "line": token.line,
+            "col": token.column,
+        }
 
-            # REASONING: String fallback enables default type handling and text value preservation for fallback workflows.
-            # Fallback workflows require string fallback for default type handling and text value preservation in fallback workflows.
-            # String fallback supports default type handling, text value preservation, and fallback coordination while enabling
-            # comprehensive fallback strategies and systematic string workflows.
-            return {
-                "type": "string",
-                "value": env_value,
-                "line": token["line"],
-                "col": token["col"],
-                "env_var": var_name,
-            }
+    def _primary_number(self, token: Token) -> Dict[str, Any]:
+        """Parse a numeric literal operand."""
+        self.pos += 1
+        try:
+            value_type, value = _classify_number(token.value)
+        except ValueError:
+            raise self._create_syntax_error("Invalid number format", token)
+        return {
+            "type": value_type,
+            "value": value,
+            "line": token.line,
+            "col": token.column,
+        }
 
-        # REASONING: Null identifier handling enables empty value processing and null literal support for null workflows.
-        # Null workflows require identifier handling for empty value processing and null literal support in null workflows.
-        # Null identifier handling supports empty value processing, null literal support, and null coordination while enabling
-        # comprehensive handling strategies and systematic null workflows.
-        elif token["type"] == "IDENTIFIER" and token["value"].lower() == "null":
-            self._consume("IDENTIFIER", "null")
-            return {
-                "type": "null",
-                "value": None,
-                "line": token["line"],
-                "col": token["col"],
-            }
+    def _primary_boolean(self, token: Token) -> Dict[str, Any]:
+        """Parse a boolean literal operand."""
+        self.pos += 1
+        value = _BOOLEAN_VALUES.get(token.value)
+        if value is None:  # Other casings only come from hand-built tokens
+            value = token.value.lower() == "true"
+        return {
+            "type": "boolean",
+            "value": value,
+            "line": token.line,
+            "col": token.column,
+        }
 
-        # REASONING: Error handling enables invalid token detection and parsing failure reporting for error workflows.
-        # Error workflows require error handling for invalid token detection and parsing failure reporting in error workflows.
-        # Error handling supports invalid token detection, parsing failure reporting, and error coordination while enabling
-        # comprehensive error strategies and systematic parsing error workflows.
-        raise self._create_syntax_error(
-            f"Unexpected token in expression: {token['value']}", token
-        )
+    def _primary_env(self, token: Token) -> Dict[str, Any]:
+        """Parse a ``${VAR}`` or ``${VAR:-default}`` operand."""
+        content = self.cooked[self.pos]  # Stripped of ${ and } at load time
+        self.pos += 1
+        var_name, env_value = self._resolve_env(content, token)
+
+        value_type, value = _classify_env_value(env_value)
+        return {
+            "type": value_type,
+            "value": value,
+            "line": token.line,
+            "col": token.column,
+            "env_var": var_name,
+        }
+
+    def _primary_identifier(self, token: Token) -> Dict[str, Any]:
+        """Parse an identifier operand; only ``null`` is a valid one."""
+        if token.value.lower() != "null":
+            raise self._create_syntax_error(
+                f"Unexpected token in expression: {token.value}", token
+            )
+        self._consume("IDENTIFIER", "null")
+        return {
+            "type": "null",
+            "value": None,
+            "line": token.line,
+            "col": token.column,
+        }
 
-    # REASONING: Binary operation evaluation enables mathematical expression computation and value processing for evaluation workflows.
-    # Evaluation workflows require binary operation evaluation for mathematical expression computation and value processing in evaluation workflows.
-    # Binary operation evaluation supports mathematical expression computation, value processing, and evaluation coordination while enabling
-    # comprehensive evaluation strategies and systematic computation workflows.
     def _evaluate_binary_op(
         self, left: Dict[str, Any], operator: str, right: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Evaluate a binary operation between two values."""
-        # REASONING: Value extraction enables operand preparation and type checking for extraction workflows.
-        # Extraction workflows require value extraction for operand preparation and type checking in extraction workflows.
-        # Value extraction supports operand preparation, type checking, and extraction coordination while enabling
-        # comprehensive extraction strategies and systematic operand workflows.
         left_val = left["value"]
         right_val = right["value"]
         left_type = left["type"]
         right_type = right["type"]
 
-        # REASONING: String concatenation enables text combination and string operation support for concatenation workflows.
-        # Concatenation workflows require string concatenation for text combination and string operation support in concatenation workflows.
-        # String concatenation supports text combination, string operation support, and concatenation coordination while enabling
-        # comprehensive concatenation strategies and systematic string workflows.
-        if operator == "+" and (left_type == "string" or right_type == "string"):
-            result_val = str(left_val) + str(
-                right_val
-            )  # Coerce to strings and concatenate
+        if left_type in _NUMERIC_TYPES and right_type in _NUMERIC_TYPES:
+            if operator == "/" and right_val == 0:
+                raise self._create_syntax_error(
+                    "Error in expression evaluation: Division by zero in expression"
+                )
+            apply = _NUM_OPS.get(operator)
+            if apply is None:
+                raise self._create_syntax_error(
+                    f"Error in expression evaluation: Unsupported operator: {operator}"
+                )
+            # OverflowError is reported by _parse_expression
+            result_val = apply(left_val, right_val)
+
             return {
-                "type": "string",
+                "type": "float" if type(result_val) is float else "integer",
                 "value": result_val,
                 "line": left.get("line", 1),
                 "col": left.get("col", 1),
                 "expression": True,
             }
 
-        # REASONING: Numeric operations enable mathematical computation and arithmetic evaluation for numeric workflows.
-        # Numeric workflows require numeric operations for mathematical computation and arithmetic evaluation in numeric workflows.
-        # Numeric operations support mathematical computation, arithmetic evaluation, and numeric coordination while enabling
-        # comprehensive operation strategies and systematic numeric workflows.
-        if left_type in ["integer", "float"] and right_type in ["integer", "float"]:
-            try:
-                # REASONING: Arithmetic operation dispatch enables calculation execution and mathematical processing for calculation workflows.
-                # Calculation workflows require arithmetic operation dispatch for calculation execution and mathematical processing in calculation workflows.
-                # Arithmetic operation dispatch supports calculation execution, mathematical processing, and calculation coordination while enabling
-                # comprehensive dispatch strategies and systematic calculation workflows.
-                if operator == "+":
-                    result_val = left_val + right_val
-                elif operator == "-":
-                    result_val = left_val - right_val
-                elif operator == "*":
-                    result_val = left_val * right_val
-                elif operator == "/":
-                    # REASONING: Division by zero checking enables error prevention and mathematical safety for safety workflows.
-                    # Safety workflows require division by zero checking for error prevention and mathematical safety in safety workflows.
-                    # Division by zero checking supports error prevention, mathematical safety, and safety coordination while enabling
-                    # comprehensive checking strategies and systematic safety workflows.
-                    if right_val == 0:
-                        raise self._create_syntax_error(
-                            "Division by zero in expression"
-                        )
-                    result_val = left_val / right_val
-                else:
-                    raise self._create_syntax_error(f"Unsupported operator: {operator}")
-
-                # REASONING: Result type determination enables type preservation and numeric accuracy for type workflows.
-                # Type workflows require result type determination for type preservation and numeric accuracy in type workflows.
-                # Result type determination supports type preservation, numeric accuracy, and type coordination while enabling
-                # comprehensive determination strategies and systematic type workflows.
-                result_type = "float" if isinstance(result_val, float) else "integer"
-
-                return {
-                    "type": result_type,
-                    "value": result_val,
-                    "line": left.get("line", 1),
-                    "col": left.get("col", 1),
-                    "expression": True,
-                }
-            except Exception as e:
-                # REASONING: Exception handling enables computation error management and failure reporting for error workflows.
-                # Error workflows require exception handling for computation error management and failure reporting in error workflows.
-                # Exception handling supports computation error management, failure reporting, and error coordination while enabling
-                # comprehensive handling strategies and systematic error workflows.
-                raise self._create_syntax_error(
-                    f"Error in expression evaluation: {str(e)}"
-                )
+        if operator == "+" and (left_type == "string" or right_type == "string"):
+            return {
+                "type": "string",
+                "value": str(left_val) + str(right_val),  # Coerce and concatenate
+                "line": left.get("line", 1),
+                "col": left.get("col", 1),
+                "expression": True,
+            }
 
-        # REASONING: Type compatibility error enables invalid operation detection and type safety for compatibility workflows.
-        # Compatibility workflows require type compatibility error for invalid operation detection and type safety in compatibility workflows.
-        # Type compatibility error supports invalid operation detection, type safety, and compatibility coordination while enabling
-        # comprehensive error strategies and systematic compatibility workflows.
         raise self._create_syntax_error(
             f"Cannot apply operator '{operator}' to {left_type} and {right_type}"
         )
 
-    # REASONING: Consume method enables token consumption and parsing state advancement for consumption workflows.
-    # Consumption workflows require consume method for token consumption and parsing state advancement in consumption workflows.
-    # Consume method supports token consumption, parsing state advancement, and consumption coordination while enabling
-    # comprehensive consumption strategies and systematic parsing workflows.
-    def _consume(self, expected_type: str = None, expected_value: str = None) -> Dict:
+    def _consume(self, expected_type: str = None, expected_value: str = None) -> Token:
         """Consume the current token if it matches the expected type and/or value.
 
         Args:
@@ -781,21 +826,13 @@ class Parser:
             expected_value: The expected token value (e.g., '=', '{', '}')
 
         Returns:
-            Dict: The consumed token
+            Token: The consumed token
 
         Raises:
             ConfigParseError: If the current token doesn't match expectations
         """
-        # REASONING: Token retrieval enables current position access and parsing state inspection for retrieval workflows.
-        # Retrieval workflows require token retrieval for current position access and parsing state inspection in retrieval workflows.
-        # Token retrieval supports current position access, parsing state inspection, and retrieval coordination while enabling
-        # comprehensive retrieval strategies and systematic access workflows.
         token = self._current_token()
 
-        # REASONING: End-of-input handling enables parsing completion detection and error reporting for completion workflows.
-        # Completion workflows require end-of-input handling for parsing completion detection and error reporting in completion workflows.
-        # End-of-input handling supports parsing completion detection, error reporting, and completion coordination while enabling
-        # comprehensive handling strategies and systematic completion workflows.
         if token is None:
             expected = []
             if expected_type:
@@ -804,49 +841,47 @@ class Parser:
                 expected.append(f"value '{expected_value}'")
             expected_str = " or ".join(expected) or "token"
 
-            # REASONING: Error construction enables end-of-input reporting and expectation communication for error workflows.
-            # Error workflows require error construction for end-of-input reporting and expectation communication in error workflows.
-            # Error construction supports end-of-input reporting, expectation communication, and error coordination while enabling
-            # comprehensive construction strategies and systematic error workflows.
             raise self._create_syntax_error(
                 message=f"Unexpected end of input, expected {expected_str}",
                 expected=expected_str,
             )
 
-        # REASONING: Type validation enables token type checking and syntax enforcement for validation workflows.
-        # Validation workflows require type validation for token type checking and syntax enforcement in validation workflows.
-        # Type validation supports token type checking, syntax enforcement, and validation coordination while enabling
-        # comprehensive validation strategies and systematic type workflows.
-        if expected_type is not None and token["type"] != expected_type:
+        if expected_type is not None and token.type != expected_type:
             raise self._create_syntax_error(
-                message=f"Got unexpected token type '{token['type']}'",
+                message=f"Got unexpected token type '{token.type}'",
                 token=token,
                 expected=f"{expected_type}",
             )
 
-        # REASONING: Value validation enables token content checking and exact match enforcement for validation workflows.
-        # Validation workflows require value validation for token content checking and exact match enforcement in validation workflows.
-        # Value validation supports token content checking, exact match enforcement, and validation coordination while enabling
-        # comprehensive validation strategies and systematic content workflows.
-        if expected_value is not None and token["value"] != expected_value:
+        if expected_value is not None and token.value != expected_value:
             raise self._create_syntax_error(
-                message=f"Got unexpected value '{token['value']}'",
+                message=f"Got unexpected value '{token.value}'",
                 token=token,
                 expected=f"'{expected_value}'",
             )
 
-        # REASONING: Position advancement enables parsing progression and token consumption for advancement workflows.
-        # Advancement workflows require position advancement for parsing progression and token consumption in advancement workflows.
-        # Position advancement supports parsing progression, token consumption, and advancement coordination while enabling
-        # comprehensive advancement strategies and systematic progression workflows.
         self.pos += 1
         return token
 
-    # REASONING: Parameter parsing enables function signature analysis and type definition processing for parameter workflows.
-    # Parameter workflows require parameter parsing for function signature analysis and type definition processing in parameter workflows.
-    # Parameter parsing supports function signature analysis, type definition processing, and parameter coordination while enabling
-    # comprehensive parsing strategies and systematic parameter workflows.
-    def _parse_parameter(self) -> tuple:
+    def _advance(self) -> Token:
+        """Consume the current token without validating it.
+
+        Only for call sites that have already checked the token type or value;
+        use ``_consume`` everywhere else so mismatches are reported.
+        """
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _expect_punct(self, char: str) -> None:
+        """Consume the punctuation ``char``; mismatches are reported by ``_consume``."""
+        pos = self.pos
+        if pos < self._n and self.values[pos] == char and self.types[pos] is T_PUNCT:
+            self.pos = pos + 1
+        else:
+            self._consume("PUNCTUATION", char)  # Raises with the usual message
+
+    def _parse_parameter(self) -> Tuple[str, Dict[str, Any]]:
         """Parse a single parameter definition.
 
         Returns:
@@ -854,84 +889,49 @@ class Parser:
             - The parameter name as a string
             - A dictionary with parameter information (type, is_array, value, line, col, etc.)
         """
-        # REASONING: Type parsing enables parameter type identification and namespace support for type workflows.
-        # Type workflows require type parsing for parameter type identification and namespace support in type workflows.
-        # Type parsing supports parameter type identification, namespace support, and type coordination while enabling
-        # comprehensive parsing strategies and systematic type workflows.
-
-        # REASONING: Type parsing enables parameter type identification and namespace support for type workflows.
-        # Type workflows require type parsing for parameter type identification and namespace support in type workflows.
-        # Type parsing supports parameter type identification, namespace support, and type coordination while enabling
-        # comprehensive parsing strategies and systematic type workflows.
+
         param_type, type_parts = self._parse_identifier(allow_namespace=True)
 
-        # REASONING: Enum type usage detection enables enum parameter recognition and type constraint enforcement for enum workflows.
-        # Enum workflows require enum type usage detection for enum parameter recognition and type constraint enforcement in enum workflows.
-        # Enum type usage detection supports enum parameter recognition, type constraint enforcement, and enum coordination while enabling
-        # comprehensive detection strategies and systematic enum usage workflows.
         # Note: This is a simplified check - in a complete implementation, we would validate against defined enums
-        is_enum_type = "::" not in param_type and param_type not in [
-            "string",
-            "int",
-            "float",
-            "boolean",
-            "array",
-            "object",
-        ]
+        is_enum_type = "::" not in param_type and param_type not in _BUILTIN_TYPES
 
         is_array = False
+        values = self.values
+        n = self._n
 
-        # REASONING: Array notation detection enables array type recognition and collection type support for array workflows.
-        # Array workflows require array notation detection for array type recognition and collection type support in array workflows.
-        # Array notation detection supports array type recognition, collection type support, and array coordination while enabling
-        # comprehensive detection strategies and systematic array workflows.
-        if self._current_token() and self._current_token()["value"] == "[":
-            self._consume("PUNCTUATION", "[")
-            self._consume("PUNCTUATION", "]")
+        pos = self.pos
+        if pos < n and values[pos] == "[":
+            if pos + 1 < n and values[pos + 1] == "]":
+                self.pos = pos + 2  # Both brackets checked in one peek
+            else:
+                self.pos = pos + 1
+                self._expect_punct("]")  # Reports the missing bracket
             is_array = True
 
-        # REASONING: Parameter name extraction enables identifier processing and variable naming for naming workflows.
-        # Naming workflows require parameter name extraction for identifier processing and variable naming in naming workflows.
-        # Parameter name extraction supports identifier processing, variable naming, and naming coordination while enabling
-        # comprehensive extraction strategies and systematic naming workflows.
         param_name = self._consume("IDENTIFIER")
 
-        # REASONING: Default value parsing enables optional parameter support and fallback value processing for default workflows.
-        # Default workflows require default value parsing for optional parameter support and fallback value processing in default workflows.
-        # Default value parsing supports optional parameter support, fallback value processing, and default coordination while enabling
-        # comprehensive parsing strategies and systematic default workflows.
         default_value = None
-        if self._current_token() and self._current_token()["value"] == "=":
-            self._consume("PUNCTUATION", "=")
+        if self.pos < n and values[self.pos] == "=":
+            self._advance()
             default_value = self._parse_value()
 
-        # REASONING: Parameter information construction enables type metadata preservation and parsing result organization for construction workflows.
-        # Construction workflows require parameter information construction for type metadata preservation and parsing result organization in construction workflows.
-        # Parameter information construction supports type metadata preservation, parsing result organization, and construction coordination while enabling
-        # comprehensive construction strategies and systematic parameter workflows.
         param_info = {
             "type": param_type,  # Parameter type name
             "is_array": is_array,  # Array type flag
             "is_enum_type": is_enum_type,  # Enum type flag for constraint validation
             "value": default_value,  # Default value if specified
-            "line": type_parts[0]["line"],  # Line number for error reporting
-            "col": type_parts[0]["col"],  # Column position for location
+            "line": type_parts[0].line,  # Line number for error reporting
+            "col": type_parts[0].column,  # Column position for location
         }
 
-        # REASONING: Nested type handling enables complex type definition and hierarchical type support for nesting workflows.
-        # Nesting workflows require nested type handling for complex type definition and hierarchical type support in nesting workflows.
-        # Nested type handling supports complex type definition, hierarchical type support, and nesting coordination while enabling
-        # comprehensive handling strategies and systematic nesting workflows.
-        if self._current_token() and self._current_token()["value"] == "(":
-            param_info["nested"] = self._parse_object()
+        if self.pos < n and values[self.pos] == "(":
+            param_info["nested"] = self._wrap_top_level(self._parse_object())
 
-        return param_name["value"], param_info
+        return param_name.value, param_info
 
-    # REASONING: Identifier parsing enables name resolution and namespace support for identifier workflows.
-    # Identifier workflows require identifier parsing for name resolution and namespace support in identifier workflows.
-    # Identifier parsing supports name resolution, namespace support, and identifier coordination while enabling
-    # comprehensive parsing strategies and systematic identifier workflows.
-    def _parse_identifier(self, allow_namespace=True) -> tuple:
+    def _parse_identifier(
+        self, allow_namespace: bool = True
+    ) -> Tuple[str, List[Token]]:
         """Parse an identifier, which could be a simple name or a namespaced name.
 
         Args:
@@ -945,41 +945,29 @@ class Parser:
         Raises:
             ConfigParseError: If the identifier is invalid or incomplete
         """
-        # REASONING: Identifier validation enables name token checking and parsing safety for validation workflows.
-        # Validation workflows require identifier validation for name token checking and parsing safety in validation workflows.
-        # Identifier validation supports name token checking, parsing safety, and validation coordination while enabling
-        # comprehensive validation strategies and systematic identifier workflows.
-        if not self._current_token() or self._current_token()["type"] != "IDENTIFIER":
-            token = self._current_token()
+        tokens = self.tokens
+        types = self.types
+        n = self._n
+        pos = self.pos
+        if pos >= n or types[pos] != T_IDENT:
             raise self._create_syntax_error(
-                message="Expected an identifier", token=token, expected="identifier"
+                message="Expected an identifier",
+                token=self._current_token(),
+                expected="identifier",
             )
 
-        # REASONING: Name part collection enables identifier component tracking and namespace construction for collection workflows.
-        # Collection workflows require name part collection for identifier component tracking and namespace construction in collection workflows.
-        # Name part collection supports identifier component tracking, namespace construction, and collection coordination while enabling
-        # comprehensive collection strategies and systematic identifier workflows.
-        name_parts = [self._consume("IDENTIFIER")]
-
-        # REASONING: Namespace processing enables hierarchical naming and scope resolution for namespace workflows.
-        # Namespace workflows require namespace processing for hierarchical naming and scope resolution in namespace workflows.
-        # Namespace processing supports hierarchical naming, scope resolution, and namespace coordination while enabling
-        # comprehensive processing strategies and systematic namespace workflows.
-        if allow_namespace:
-            while (
-                self._current_token() and self._current_token()["type"] == "NAMESPACE"
-            ):
-                namespace_token = self._current_token()
-                self._consume("NAMESPACE")
-
-                # REASONING: Namespace continuation validation enables proper identifier chaining and syntax enforcement for continuation workflows.
-                # Continuation workflows require namespace continuation validation for proper identifier chaining and syntax enforcement in continuation workflows.
-                # Namespace continuation validation supports proper identifier chaining, syntax enforcement, and continuation coordination while enabling
-                # comprehensive validation strategies and systematic continuation workflows.
-                if (
-                    not self._current_token()
-                    or self._current_token()["type"] != "IDENTIFIER"
-                ):
+        first = tokens[pos]
+        token_parts = [first]
+        name_buf = [first.value]
+        pos += 1
+
+        if allow_namespace and self._has_namespace:
+            while pos < n and types[pos] == T_NAMESPACE:
+                namespace_token = tokens[pos]
+                pos += 1
+
+                if pos >= n or types[pos] != T_IDENT:
+                    self.pos = pos
                     raise self._create_syntax_error(
                         message="Incomplete namespaced identifier",
                         token=namespace_token,
@@ -987,136 +975,94 @@ class Parser:
                     )
 
                 # The next token must be an identifier
-                name_parts.append("::")
-                name_parts.append(self._consume("IDENTIFIER"))
-
-        # REASONING: Name construction enables identifier assembly and namespace concatenation for construction workflows.
-        # Construction workflows require name construction for identifier assembly and namespace concatenation in construction workflows.
-        # Name construction supports identifier assembly, namespace concatenation, and construction coordination while enabling
-        # comprehensive construction strategies and systematic identifier workflows.
-        full_name = "".join(
-            part["value"] if isinstance(part, dict) else part for part in name_parts
-        )
-        return full_name, [part for part in name_parts if isinstance(part, dict)]
+                token = tokens[pos]
+                token_parts.append(token)
+                name_buf.append("::")
+                name_buf.append(token.value)
+                pos += 1
 
-    # REASONING: Object parsing enables configuration object processing and structured data handling for object workflows.
-    # Object workflows require object parsing for configuration object processing and structured data handling in object workflows.
-    # Object parsing supports configuration object processing, structured data handling, and object coordination while enabling
-    # comprehensive parsing strategies and systematic object workflows.
-    def _parse_object(self, is_top_level: bool = True) -> Dict:
-        """Parse an object definition.
+        self.pos = pos
 
-        Args:
-            is_top_level: Whether this is a top-level object (affects return structure)
+        # Type names repeat across a document; interning shares one string per name
+        full_name = sys.intern("".join(name_buf))
+        return full_name, token_parts
+
+    def _parse_object(self) -> Dict:
+        """Parse an object definition.
 
         Returns:
-            A dictionary representing the parsed object with the following structure:
-            - If is_top_level is True:
-                {
-                    'body': {
-                        'TypeName': {
-                            'name': 'TypeName',
-                            'body': { ...nested properties... },
-                            'line': int,
-                            'col': int
-                        }
-                    }
-                }
-            - If is_top_level is False:
+            A dictionary representing the parsed object:
                 {
                     'name': 'TypeName',
                     'body': { ...nested properties... },
                     'line': int,
                     'col': int
                 }
+            Callers that need the top-level ``{'body': {...}}`` form apply
+            ``_wrap_top_level`` to the result.
+        """
+        result = self._parse_object_header()
+        result["body"] = self._parse_object_body()
+        return result
+
+    def _parse_object_header(self) -> Dict:
+        """Parse an object's type name and optional parameter list.
+
+        Returns:
+            The object dictionary with an empty 'body', positioned at the
+            opening brace (if any).
         """
-        # REASONING: Object name parsing enables type identification and namespace resolution for identification workflows.
-        # Identification workflows require object name parsing for type identification and namespace resolution in identification workflows.
-        # Object name parsing supports type identification, namespace resolution, and identification coordination while enabling
-        # comprehensive parsing strategies and systematic identification workflows.
         full_name, name_parts = self._parse_identifier()
 
-        # REASONING: Position tracking enables error location and parsing context preservation for tracking workflows.
-        # Tracking workflows require position tracking for error location and parsing context preservation in tracking workflows.
-        # Position tracking supports error location, parsing context preservation, and tracking coordination while enabling
-        # comprehensive tracking strategies and systematic location workflows.
-        start_line = name_parts[0]["line"]
-        start_col = name_parts[0]["col"]
-
-        # REASONING: Parameter parsing enables function signature processing and type definition support for parameter workflows.
-        # Parameter workflows require parameter parsing for function signature processing and type definition support in parameter workflows.
-        # Parameter parsing supports function signature processing, type definition support, and parameter coordination while enabling
-        # comprehensive parsing strategies and systematic parameter workflows.
+        start_line = name_parts[0].line
+        start_col = name_parts[0].column
+
+        values = self.values
+        n = self._n
         params = {}
-        if self._current_token() and self._current_token()["value"] == "(":
-            self._consume("PUNCTUATION", "(")
-
-            # REASONING: Parameter iteration enables parameter list processing and function signature construction for iteration workflows.
-            # Iteration workflows require parameter iteration for parameter list processing and function signature construction in iteration workflows.
-            # Parameter iteration supports parameter list processing, function signature construction, and iteration coordination while enabling
-            # comprehensive iteration strategies and systematic parameter workflows.
-            while self._current_token() and self._current_token()["value"] != ")":
-                param_name, param_info = self._parse_parameter()
-                params[param_name] = param_info
-
-                # REASONING: Parameter separation handling enables comma-separated list parsing and syntax compliance for separation workflows.
-                # Separation workflows require parameter separation handling for comma-separated list parsing and syntax compliance in separation workflows.
-                # Parameter separation handling supports comma-separated list parsing, syntax compliance, and separation coordination while enabling
-                # comprehensive handling strategies and systematic separation workflows.
-                if self._current_token() and self._current_token()["value"] == ",":
-                    self._consume("PUNCTUATION", ",")
-                else:
-                    break
+        pos = self.pos
+        if pos < n and values[pos] == "(":
+            if pos + 1 < n and values[pos + 1] == ")":
+                self.pos = pos + 2  # Empty parameter list
+            else:
+                self.pos = pos + 1
+                parse_parameter = self._parse_parameter
+                pairs = []  # (name, info) in source order; built into a dict once
 
-            self._consume("PUNCTUATION", ")")
+                while self.pos < n and values[self.pos] != ")":
+                    pairs.append(parse_parameter())
 
-        # REASONING: Object body parsing enables property collection and structural content processing for body workflows.
-        # Body workflows require object body parsing for property collection and structural content processing in body workflows.
-        # Object body parsing supports property collection, structural content processing, and body coordination while enabling
-        # comprehensive parsing strategies and systematic body workflows.
-        body = self._parse_object_body()
+                    if self.pos < n and values[self.pos] == ",":
+                        self.pos += 1
+                    else:
+                        break
 
-        # REASONING: Parameter body handling enables simplified return structure and value optimization for optimization workflows.
-        # Optimization workflows require parameter body handling for simplified return structure and value optimization in optimization workflows.
-        # Parameter body handling supports simplified return structure, value optimization, and optimization coordination while enabling
-        # comprehensive handling strategies and systematic optimization workflows.
-        # Note: Removed early return to ensure consistent object structure for nested parsing
+                self._expect_punct(")")
+                params = dict(pairs)
 
-        # REASONING: Result construction enables object metadata assembly and parsing result organization for construction workflows.
-        # Construction workflows require result construction for object metadata assembly and parsing result organization in construction workflows.
-        # Result construction supports object metadata assembly, parsing result organization, and construction coordination while enabling
-        # comprehensive construction strategies and systematic result workflows.
         result = {
             "name": full_name,  # Object type name
-            "body": body or {},  # Object properties
+            "body": {},  # Object properties, filled in by the caller
             "line": start_line,  # Line number for errors
             "col": start_col,  # Column position for location
         }
 
-        # REASONING: Parameter integration enables function signature inclusion and complete object representation for integration workflows.
-        # Integration workflows require parameter integration for function signature inclusion and complete object representation in integration workflows.
-        # Parameter integration supports function signature inclusion, complete object representation, and integration coordination while enabling
-        # comprehensive integration strategies and systematic parameter workflows.
         if params:
             result["params"] = params
 
-        # REASONING: Top-level wrapping enables proper nesting structure and parsing result consistency for wrapping workflows.
-        # Wrapping workflows require top-level wrapping for proper nesting structure and parsing result consistency in wrapping workflows.
-        # Top-level wrapping supports proper nesting structure, parsing result consistency, and wrapping coordination while enabling
-        # comprehensive wrapping strategies and systematic structure workflows.
-        if is_top_level and (
-            self._current_token() is None
-            or self._current_token()["value"] not in {",", ";", "="}
-        ):
-            return {"body": {full_name: result}}
+        return result
+
+    def _wrap_top_level(self, result: Dict) -> Dict:
+        """Wrap a just-parsed object as ``{'body': {name: object}}``.
 
+        The object stays unwrapped when it is followed by ``,``, ``;`` or ``=``.
+        """
+        pos = self.pos
+        if pos >= self._n or self.values[pos] not in _END_TOKENS:
+            return {"body": {result["name"]: result}}
         return result
 
-    # REASONING: Value parsing enables configuration value processing and data type handling for value workflows.
-    # Value workflows require value parsing for configuration value processing and data type handling in value workflows.
-    # Value parsing supports configuration value processing, data type handling, and value coordination while enabling
-    # comprehensive parsing strategies and systematic value workflows.
-    def _parse_value(self):
+    def _parse_value(self) -> Any:
         """Parse a value, which can be a literal, array, object, constructor call, or expression.
 
         Returns:
@@ -1125,629 +1071,284 @@ class Parser:
         Raises:
             ConfigParseError: If there's a syntax error in the value
         """
-        # REASONING: Input validation enables parsing safety and error prevention for validation workflows.
-        # Validation workflows require input validation for parsing safety and error prevention in validation workflows.
-        # Input validation supports parsing safety, error prevention, and validation coordination while enabling
-        # comprehensive validation strategies and systematic value workflows.
-        if not self._current_token():
+        pos = self.pos
+        if pos >= self._n:
             raise self._create_syntax_error(
                 "Unexpected end of input while expecting a value"
             )
 
-        # REASONING: Expression detection enables mathematical operation recognition and calculation support for detection workflows.
-        # Detection workflows require expression detection for mathematical operation recognition and calculation support in detection workflows.
-        # Expression detection supports mathematical operation recognition, calculation support, and detection coordination while enabling
-        # comprehensive detection strategies and systematic expression workflows.
         if self._is_expression_start():
             return self._parse_expression()
 
-        token = self._current_token()
-
-        # REASONING: Token type dispatch enables value type processing and data handling for dispatch workflows.
-        # Dispatch workflows require token type dispatch for value type processing and data handling in dispatch workflows.
-        # Token type dispatch supports value type processing, data handling, and dispatch coordination while enabling
-        # comprehensive dispatch strategies and systematic value workflows.
-        if token["type"] == "ENV_VAR":
-            # REASONING: Environment variable processing enables dynamic configuration and runtime substitution for substitution workflows.
-            # Substitution workflows require environment variable processing for dynamic configuration and runtime substitution in substitution workflows.
-            # Environment variable processing supports dynamic configuration, runtime substitution, and substitution coordination while enabling
-            # comprehensive processing strategies and systematic substitution workflows.
-            env_token = self._consume("ENV_VAR")["value"]
-            env_content = env_token[2:-1]  # Remove ${ and } delimiters
-
-            # REASONING: Default value parsing enables fallback configuration and missing variable handling for fallback workflows.
-            # Fallback workflows require default value parsing for fallback configuration and missing variable handling in fallback workflows.
-            # Default value parsing supports fallback configuration, missing variable handling, and fallback coordination while enabling
-            # comprehensive parsing strategies and systematic fallback workflows.
-            if ":-" in env_content:
-                var_name, default_value = env_content.split(":-", 1)
-                if default_value.startswith('"') and default_value.endswith('"'):
-                    default_value = default_value[1:-1]  # Remove quotes from default
-            else:
-                var_name = env_content
-                default_value = None
-
-            # REASONING: Environment resolution enables system variable access and configuration externalization for resolution workflows.
-            # Resolution workflows require environment resolution for system variable access and configuration externalization in resolution workflows.
-            # Environment resolution supports system variable access, configuration externalization, and resolution coordination while enabling
-            # comprehensive resolution strategies and systematic environment workflows.
-            env_value = os.getenv(var_name, default_value)
-
-            if env_value is None:
-                raise self._create_syntax_error(
-                    f"Environment variable '{var_name}' is not set and no default provided",
-                    token,
-                )
+        token = self.tokens[pos]
 
-            # REASONING: Type inference enables automatic type detection and value conversion for inference workflows.
-            # Inference workflows require type inference for automatic type detection and value conversion in inference workflows.
-            # Type inference supports automatic type detection, value conversion, and inference coordination while enabling
-            # comprehensive inference strategies and systematic type workflows.
-            if env_value.lower() in ("true", "false"):
-                return {
-                    "type": "boolean",
-                    "value": env_value.lower() == "true",
-                    "line": token["line"],
-                    "col": token["col"],
-                    "env_var": var_name,
-                }
+        handler = _VALUE_HANDLERS.get(token.type)
+        if handler is not None:
+            return handler(self, token)
 
-            # REASONING: Integer conversion enables numeric type detection and whole number support for conversion workflows.
-            # Conversion workflows require integer conversion for numeric type detection and whole number support in conversion workflows.
-            # Integer conversion supports numeric type detection, whole number support, and conversion coordination while enabling
-            # comprehensive conversion strategies and systematic numeric workflows.
-            try:
-                int_value = int(env_value)
-                return {
-                    "type": "integer",
-                    "value": int_value,
-                    "line": token["line"],
-                    "col": token["col"],
-                    "env_var": var_name,
-                }
-            except ValueError:
-                pass  # Try float conversion next
-
-            # REASONING: Float conversion enables decimal number detection and floating-point support for float workflows.
-            # Float workflows require float conversion for decimal number detection and floating-point support in float workflows.
-            # Float conversion supports decimal number detection, floating-point support, and float coordination while enabling
-            # comprehensive conversion strategies and systematic float workflows.
-            try:
-                float_value = float(env_value)
-                return {
-                    "type": "float",
-                    "value": float_value,
-                    "line": token["line"],
-                    "col": token["col"],
-                    "env_var": var_name,
-                }
-            except ValueError:
-                pass  # Default to string type
-
-            # REASONING: String fallback enables default type handling and text preservation for fallback workflows.
-            # Fallback workflows require string fallback for default type handling and text preservation in fallback workflows.
-            # String fallback supports default type handling, text preservation, and fallback coordination while enabling
-            # comprehensive fallback strategies and systematic string workflows.
-            return {
-                "type": "string",
-                "value": env_value,
-                "line": token["line"],
-                "col": token["col"],
-                "env_var": var_name,
-            }
-
-        # REASONING: String literal processing enables text value handling and quote removal for text workflows.
-        # Text workflows require string literal processing for text value handling and quote removal in text workflows.
-        # String literal processing supports text value handling, quote removal, and text coordination while enabling
-        # comprehensive processing strategies and systematic text workflows.
-        elif token["type"] == "STRING":
-            value = self._consume("STRING")["value"]
-            value = value[1:-1]  # Remove surrounding quotes
-            return {
-                "type": "string",
-                "value": value,
-                "line": token["line"],
-                "col": token["col"],
-            }
+        if token.value == "[":
+            return self._parse_array()
 
-        # REASONING: Number parsing enables numeric value processing and type determination for numeric workflows.
-        # Numeric workflows require number parsing for numeric value processing and type determination in numeric workflows.
-        # Number parsing supports numeric value processing, type determination, and numeric coordination while enabling
-        # comprehensive parsing strategies and systematic numeric workflows.
-        elif token["type"] == "NUMBER":
-            value = self._consume("NUMBER")["value"]
-            try:
-                value = int(value)  # Try integer first
-                value_type = "integer"
-            except ValueError:
-                try:
-                    value = float(value)  # Fall back to float
-                    value_type = "float"
-                except ValueError:
-                    raise self._create_syntax_error("Invalid number format", token)
+        elif token.value == "{":
+            return self._parse_object()
 
-            return {
-                "type": value_type,
-                "value": value,
-                "line": token["line"],
-                "col": token["col"],
-            }
-
-        # REASONING: Boolean parsing enables logical value processing and true/false determination for boolean workflows.
-        # Boolean workflows require boolean parsing for logical value processing and true/false determination in boolean workflows.
-        # Boolean parsing supports logical value processing, true/false determination, and boolean coordination while enabling
-        # comprehensive parsing strategies and systematic boolean workflows.
-        elif token["type"] == "BOOLEAN":
-            value = self._consume("BOOLEAN")["value"]
-            return {
-                "type": "boolean",
-                "value": value.lower() == "true",  # Convert to boolean
-                "line": token["line"],
-                "col": token["col"],
-            }
+        raise self._create_syntax_error(
+            f"Unexpected token: {token.type} '{token.value}'",
+            token,
+            expected="a value (string, number, boolean, null, array, object, or constructor call)",
+        )
 
-        # REASONING: Null identifier handling enables empty value processing and null literal support for null workflows.
-        # Null workflows require identifier handling for empty value processing and null literal support in null workflows.
-        # Null identifier handling supports empty value processing, null literal support, and null coordination while enabling
-        # comprehensive handling strategies and systematic null workflows.
-        elif token["type"] == "IDENTIFIER" and token["value"].lower() == "null":
+    def _parse_ident_or_ctor(self, token: Token) -> Any:
+        """Parse an identifier value: null, a constructor call or a typed object."""
+        pos = self.pos
+        n = self._n
+        if token.value.lower() == "null":
             self._consume("IDENTIFIER", "null")
             return {
                 "type": "null",
                 "value": None,
-                "line": token["line"],
-                "col": token["col"],
+                "line": token.line,
+                "col": token.column,
             }
 
-        # REASONING: Array literal detection enables collection processing and list structure support for array workflows.
-        # Array workflows require array literal detection for collection processing and list structure support in array workflows.
-        # Array literal detection supports collection processing, list structure support, and array coordination while enabling
-        # comprehensive detection strategies and systematic array workflows.
-        elif token["value"] == "[":
-            return self._parse_array()
-
-        # REASONING: Object literal detection enables structured data processing and nested object support for object workflows.
-        # Object workflows require object literal detection for structured data processing and nested object support in object workflows.
-        # Object literal detection supports structured data processing, nested object support, and object coordination while enabling
-        # comprehensive detection strategies and systematic object workflows.
-        elif token["value"] == "{":
-            return self._parse_object(is_top_level=False)
-
-        # REASONING: Constructor call detection enables function invocation and parameterized object creation for constructor workflows.
-        # Constructor workflows require constructor call detection for function invocation and parameterized object creation in constructor workflows.
-        # Constructor call detection supports function invocation, parameterized object creation, and constructor coordination while enabling
-        # comprehensive detection strategies and systematic constructor workflows.
-        elif (
-            token["type"] == "IDENTIFIER"
-            and self._current_token(1)
-            and self._current_token(1)["value"] == "("
-        ):
+        if pos + 1 < n and self.values[pos + 1] == "(":
             return self._parse_constructor_call()
 
-        # REASONING: Identifier handling enables variable reference and name resolution for identifier workflows.
-        # Identifier workflows require identifier handling for variable reference and name resolution in identifier workflows.
-        # Identifier handling supports variable reference, name resolution, and identifier coordination while enabling
-        # comprehensive handling strategies and systematic identifier workflows.
-        elif token["type"] == "IDENTIFIER":
-            # REASONING: Lookahead parsing enables object constructor detection and namespaced type recognition for lookahead workflows.
-            # Lookahead workflows require lookahead parsing for object constructor detection and namespaced type recognition in lookahead workflows.
-            # Lookahead parsing supports object constructor detection, namespaced type recognition, and lookahead coordination while enabling
-            # comprehensive parsing strategies and systematic lookahead workflows.
-            lookahead = 1
-            while (
-                self._current_token(lookahead)
-                and self._current_token(lookahead)["type"] == "NAMESPACE"
-                and self._current_token(lookahead + 1)
-                and self._current_token(lookahead + 1)["type"] == "IDENTIFIER"
-            ):
-                lookahead += 2  # Skip namespace separator and identifier
-
-            # REASONING: Object constructor recognition enables typed object creation and structured initialization for constructor workflows.
-            # Constructor workflows require object constructor recognition for typed object creation and structured initialization in constructor workflows.
-            # Object constructor recognition supports typed object creation, structured initialization, and constructor coordination while enabling
-            # comprehensive recognition strategies and systematic constructor workflows.
-            if (
-                self._current_token(lookahead)
-                and self._current_token(lookahead)["value"] == "{"
-            ):
-                # Parse as constructor call with direct property access
-                obj_result = self._parse_object(is_top_level=False)
-
-                # REASONING: Constructor flattening enables direct property access and test compatibility for constructor workflows.
-                # Constructor workflows require constructor flattening for direct property access and test compatibility in constructor workflows.
-                # Constructor flattening supports direct property access, test compatibility, and constructor coordination while enabling
-                # comprehensive flattening strategies and systematic constructor workflows.
-                # Flatten constructor call structure: properties should be directly accessible under 'value'
-                flattened_result = {
-                    "type": obj_result.get("name", "object"),
-                    "line": obj_result.get("line", token["line"]),
-                    "col": obj_result.get("col", token["col"]),
-                }
+        chain_end = self._chain_end
+        end = pos + 1 if chain_end is None else chain_end[pos]
 
-                # Merge body properties directly into the result
-                if "body" in obj_result:
-                    flattened_result.update(obj_result["body"])
+        if end < n and self.values[end] == "{":
+            # Parse as constructor call with direct property access
+            obj_result = self._parse_object()  # Always sets name, body, line and col
 
-                return flattened_result
+            # Flatten constructor call structure: properties should be directly accessible under 'value'
+            return {
+                "type": obj_result["name"],
+                "line": obj_result["line"],
+                "col": obj_result["col"],
+                **obj_result["body"],  # Body properties merged directly into the result
+            }
 
-        # REASONING: Error handling enables syntax validation and invalid token reporting for error workflows.
-        # Error workflows require error handling for syntax validation and invalid token reporting in error workflows.
-        # Error handling supports syntax validation, invalid token reporting, and error coordination while enabling
-        # comprehensive handling strategies and systematic error workflows.
-        else:
-            raise self._create_syntax_error(
-                f"Unexpected token: {token['type']} '{token['value']}'",
-                token,
-                expected="a value (string, number, boolean, null, array, object, or constructor call)",
-            )
+        return None  # Bare identifier that is not part of an expression
 
-    # REASONING: Key-value pair parsing enables configuration assignment and typed declaration processing for pair workflows.
-    # Pair workflows require key-value pair parsing for configuration assignment and typed declaration processing in pair workflows.
-    # Key-value pair parsing supports configuration assignment, typed declaration processing, and pair coordination while enabling
-    # comprehensive parsing strategies and systematic pair workflows.
-    def _parse_key_value_pair(self):
+    def _parse_key_value_pair(self) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
         """Parse a key-value pair like 'key = value' or 'TypeName name = value'.
 
+        A typed declaration is recognised by the identifier that follows the
+        (possibly namespaced) type name, so nothing is parsed twice.
+
         Returns:
             A tuple of (key_name, value_info) if a key-value pair was parsed,
             or (None, None) if the current position doesn't contain a key-value pair.
         """
-        # REASONING: Position tracking enables backtrack capability and parsing state management for tracking workflows.
-        # Tracking workflows require position tracking for backtrack capability and parsing state management in tracking workflows.
-        # Position tracking supports backtrack capability, parsing state management, and tracking coordination while enabling
-        # comprehensive tracking strategies and systematic position workflows.
         start_pos = self.pos
+        types = self.types
+        values = self.values
+        n = self._n
 
-        try:
-            # REASONING: Type identification enables typed parameter recognition and namespace resolution for identification workflows.
-            # Identification workflows require type identification for typed parameter recognition and namespace resolution in identification workflows.
-            # Type identification supports typed parameter recognition, namespace resolution, and identification coordination while enabling
-            # comprehensive identification strategies and systematic type workflows.
-            type_name, _ = self._parse_identifier(allow_namespace=True)
-
-            # REASONING: Type-name pair detection enables variable declaration and strong typing support for declaration workflows.
-            # Declaration workflows require type-name pair detection for variable declaration and strong typing support in declaration workflows.
-            # Type-name pair detection supports variable declaration, strong typing support, and declaration coordination while enabling
-            # comprehensive detection strategies and systematic declaration workflows.
-            if self._current_token() and self._current_token()["type"] == "IDENTIFIER":
-                key_name = self._consume("IDENTIFIER")[
-                    "value"
-                ]  # This is a typed declaration
-                is_type_declaration = True
-            else:
-                # REASONING: Fallback parsing enables regular key handling and simple assignment support for fallback workflows.
-                # Fallback workflows require fallback parsing for regular key handling and simple assignment support in fallback workflows.
-                # Fallback parsing supports regular key handling, simple assignment support, and fallback coordination while enabling
-                # comprehensive parsing strategies and systematic fallback workflows.
-                self.pos = start_pos  # Reset position for regular key parsing
-                key_name = self._consume("IDENTIFIER")["value"]
-                is_type_declaration = False
-
-            # REASONING: Array notation detection enables collection type recognition and array parameter support for array workflows.
-            # Array workflows require array notation detection for collection type recognition and array parameter support in array workflows.
-            # Array notation detection supports collection type recognition, array parameter support, and array coordination while enabling
-            # comprehensive detection strategies and systematic array workflows.
-            is_array = False
-            if self._current_token() and self._current_token()["value"] == "[":
-                self._consume("PUNCTUATION", "[")
-                self._consume("PUNCTUATION", "]")  # Empty brackets indicate array type
-                is_array = True
-
-            # REASONING: Assignment operator validation enables key-value relationship and assignment detection for validation workflows.
-            # Validation workflows require assignment operator validation for key-value relationship and assignment detection in validation workflows.
-            # Assignment operator validation supports key-value relationship, assignment detection, and validation coordination while enabling
-            # comprehensive validation strategies and systematic assignment workflows.
-            if not (self._current_token() and self._current_token()["value"] == "="):
-                self.pos = start_pos  # Not a key-value pair, backtrack
-                return None, None
-
-            self._consume("PUNCTUATION", "=")
-            value = self._parse_value()
-
-            # REASONING: Result construction enables metadata preservation and type information packaging for construction workflows.
-            # Construction workflows require result construction for metadata preservation and type information packaging in construction workflows.
-            # Result construction supports metadata preservation, type information packaging, and construction coordination while enabling
-            # comprehensive construction strategies and systematic result workflows.
-            result = {
-                "value": value,
-                "is_array": is_array,
-                "line": self.tokens[start_pos]["line"],
-                "col": self.tokens[start_pos]["col"],
-            }
+        if start_pos >= n or types[start_pos] is not T_IDENT:
+            raise self._create_syntax_error(
+                message="Expected an identifier",
+                token=self._current_token(),
+                expected="identifier",
+            )
 
-            # Elevate params to same level as value for test compatibility
-            if isinstance(value, dict) and "params" in value:
-                result["params"] = value["params"]
-
-            # REASONING: Type annotation inclusion enables strong typing and declaration metadata for annotation workflows.
-            # Annotation workflows require type annotation inclusion for strong typing and declaration metadata in annotation workflows.
-            # Type annotation inclusion supports strong typing, declaration metadata, and annotation coordination while enabling
-            # comprehensive inclusion strategies and systematic annotation workflows.
-            if is_type_declaration:
-                result["type"] = type_name
-
-            return key_name, result
-
-        except SyntaxError:
-            # REASONING: Error recovery enables fallback parsing and syntax error handling for recovery workflows.
-            # Recovery workflows require error recovery for fallback parsing and syntax error handling in recovery workflows.
-            # Error recovery supports fallback parsing, syntax error handling, and recovery coordination while enabling
-            # comprehensive recovery strategies and systematic error workflows.
-            self.pos = start_pos  # Rewind on syntax error
-
-            # REASONING: Simple pair parsing enables basic key-value processing and untyped assignment for simple workflows.
-            # Simple workflows require simple pair parsing for basic key-value processing and untyped assignment in simple workflows.
-            # Simple pair parsing supports basic key-value processing, untyped assignment, and simple coordination while enabling
-            # comprehensive parsing strategies and systematic simple workflows.
-            if self._current_token() and self._current_token()["type"] == "IDENTIFIER":
-                key_name = self._consume("IDENTIFIER")["value"]
-
-                # REASONING: Assignment validation enables key-value detection and pair identification for validation workflows.
-                # Validation workflows require assignment validation for key-value detection and pair identification in validation workflows.
-                # Assignment validation supports key-value detection, pair identification, and validation coordination while enabling
-                # comprehensive validation strategies and systematic assignment workflows.
-                if not (
-                    self._current_token() and self._current_token()["value"] == "="
-                ):
-                    self.pos = start_pos  # Not a valid pair, backtrack
-                    return None, None
-
-                self._consume("PUNCTUATION", "=")
-                value = self._parse_value()
-
-                # REASONING: Simple result packaging enables basic metadata and value wrapping for packaging workflows.
-                # Packaging workflows require simple result packaging for basic metadata and value wrapping in packaging workflows.
-                # Simple result packaging supports basic metadata, value wrapping, and packaging coordination while enabling
-                # comprehensive packaging strategies and systematic result workflows.
-                result = {
-                    "value": value,
-                    "line": self.tokens[start_pos]["line"],
-                    "col": self.tokens[start_pos]["col"],
-                }
+        chain_end = self._chain_end
+        end = start_pos + 1 if chain_end is None else chain_end[start_pos]
+
+        if end < n and types[end] is T_IDENT:
+            type_name, _ = self._parse_identifier()  # This is a typed declaration
+            key_name = values[end]
+            self.pos = end + 1
+            is_type_declaration = True
+        else:
+            key_name = values[start_pos]
+            self.pos = start_pos + 1
+            is_type_declaration = False
+
+        is_array = False
+        if self.pos < n and values[self.pos] == "[":
+            self._advance()
+            self._expect_punct("]")  # Empty brackets indicate array type
+            is_array = True
 
-                # Elevate params to same level as value for test compatibility
-                if isinstance(value, dict) and "params" in value:
-                    result["params"] = value["params"]
+        if self.pos >= n or values[self.pos] != "=":
+            self.pos = start_pos  # Not a key-value pair, backtrack
+            return None, None
 
-                return key_name, result
+        self._advance()
+        value = self._parse_value()
 
-        # REASONING: Fallback handling enables non-pair detection and parsing continuation for fallback workflows.
-        # Fallback workflows require fallback handling for non-pair detection and parsing continuation in fallback workflows.
-        # Fallback handling supports non-pair detection, parsing continuation, and fallback coordination while enabling
-        # comprehensive handling strategies and systematic fallback workflows.
-        self.pos = start_pos  # Reset position if not a key-value pair
-        return None, None
+        start = self.tokens[start_pos]
+        result = {
+            "value": value,
+            "is_array": is_array,
+            "line": start.line,
+            "col": start.column,
+        }
+
+        _maybe_lift_params(result, value)
+
+        if is_type_declaration:
+            result["type"] = type_name
+
+        return key_name, result
 
-    # REASONING: Object body parsing enables structured content processing and nested data handling for body workflows.
-    # Body workflows require object body parsing for structured content processing and nested data handling in body workflows.
-    # Object body parsing supports structured content processing, nested data handling, and body coordination while enabling
-    # comprehensive parsing strategies and systematic body workflows.
     def _parse_object_body(self) -> Dict:
         """Parse the body of an object.
 
+        Nested objects declared directly in a body (``Name { ... }``) are
+        parsed with an explicit stack rather than by recursing through
+        ``_parse_object``, so deep nesting costs no Python frames.
+
         Returns:
             A dictionary containing the parsed key-value pairs and nested objects.
             Each value is a dictionary with at least 'value' and may include 'type', 'is_array', etc.
         """
-        # REASONING: Body initialization enables content accumulation and result collection for initialization workflows.
-        # Initialization workflows require body initialization for content accumulation and result collection in initialization workflows.
-        # Body initialization supports content accumulation, result collection, and initialization coordination while enabling
-        # comprehensive initialization strategies and systematic body workflows.
         body: Dict[str, Any] = {}
+        types = self.types
+        values = self.values
+        n = self._n
 
-        # REASONING: Opening brace validation enables object structure detection and syntax verification for validation workflows.
-        # Validation workflows require opening brace validation for object structure detection and syntax verification in validation workflows.
-        # Opening brace validation supports object structure detection, syntax verification, and validation coordination while enabling
-        # comprehensive validation strategies and systematic structure workflows.
-        if not (self._current_token() and self._current_token()["value"] == "{"):
+        pos = self.pos
+        if pos >= n or values[pos] != "{":
             return body  # Empty body if no opening brace
 
-        self._consume("PUNCTUATION", "{")
-
-        # REASONING: Content iteration enables member processing and object content parsing for iteration workflows.
-        # Iteration workflows require content iteration for member processing and object content parsing in iteration workflows.
-        # Content iteration supports member processing, object content parsing, and iteration coordination while enabling
-        # comprehensive iteration strategies and systematic content workflows.
-        while self._current_token() and self._current_token()["value"] != "}":
-            # REASONING: Include directive detection enables file inclusion and configuration composition for inclusion workflows.
-            # Inclusion workflows require include directive detection for file inclusion and configuration composition in inclusion workflows.
-            # Include directive detection supports file inclusion, configuration composition, and inclusion coordination while enabling
-            # comprehensive detection strategies and systematic inclusion workflows.
-            if self._current_token() and self._current_token()["type"] == "INCLUDE":
-                include_token = self._consume("INCLUDE")
-
-                # REASONING: Path validation enables include file verification and path string processing for path workflows.
-                # Path workflows require path validation for include file verification and path string processing in path workflows.
-                # Path validation supports include file verification, path string processing, and path coordination while enabling
-                # comprehensive validation strategies and systematic path workflows.
-                if (
-                    not self._current_token()
-                    or self._current_token()["type"] != "STRING"
-                ):
-                    raise self._create_syntax_error(
-                        "Expected string path after include directive",
-                        self._current_token(),
-                        "string path",
-                    )
+        if pos + 1 < n and values[pos + 1] == "}":
+            self.pos = pos + 2
+            return body  # Empty braces
 
-                path_token = self._consume("STRING")
-                include_path = path_token["value"][1:-1]  # Remove surrounding quotes
-
-                # REASONING: Include processing enables external file integration and configuration merging for processing workflows.
-                # Processing workflows require include processing for external file integration and configuration merging in processing workflows.
-                # Include processing supports external file integration, configuration merging, and processing coordination while enabling
-                # comprehensive processing strategies and systematic integration workflows.
-                included_data = self._process_include(include_path)
-
-                # REASONING: Data merging enables configuration composition and included content integration for merging workflows.
-                # Merging workflows require data merging for configuration composition and included content integration in merging workflows.
-                # Data merging supports configuration composition, included content integration, and merging coordination while enabling
-                # comprehensive merging strategies and systematic composition workflows.
-                if "body" in included_data:
-                    for include_key, include_value in included_data["body"].items():
-                        body[include_key] = include_value  # Merge body content
-                else:
-                    for include_key, include_value in included_data.items():
-                        body[include_key] = include_value  # Merge entire result
-
-                # REASONING: Separator handling enables optional punctuation and syntax flexibility for separator workflows.
-                # Separator workflows require separator handling for optional punctuation and syntax flexibility in separator workflows.
-                # Separator handling supports optional punctuation, syntax flexibility, and separator coordination while enabling
-                # comprehensive handling strategies and systematic separator workflows.
-                if self._current_token() and self._current_token()["value"] in [
-                    ";",
-                    ",",
-                ]:
-                    self._consume("PUNCTUATION")  # Skip optional separator
-
-                continue  # Process next object member
-
-            # REASONING: Key-value pair processing enables parameter assignment and configuration member handling for pair workflows.
-            # Pair workflows require key-value pair processing for parameter assignment and configuration member handling in pair workflows.
-            # Key-value pair processing supports parameter assignment, configuration member handling, and pair coordination while enabling
-            # comprehensive processing strategies and systematic pair workflows.
-            key, value = self._parse_key_value_pair()
+        pos += 1
+        cooked = self.cooked
+        chain_end = self._chain_end
+        stack: List[Tuple[Dict[str, Any], Dict]] = []  # (enclosing body, open object)
 
-            if key is not None:
-                body[key] = value  # Add parsed pair to body
+        # ``pos`` is a local cursor; it is stored to self.pos around every call-out
+        while True:
+            while pos < n and values[pos] != "}":
+                if types[pos] is T_INCLUDE:
+                    pos += 1
 
-                # REASONING: Comma handling enables optional separator processing and syntax flexibility for separator workflows.
-                # Separator workflows require comma handling for optional separator processing and syntax flexibility in separator workflows.
-                # Comma handling supports optional separator processing, syntax flexibility, and separator coordination while enabling
-                # comprehensive handling strategies and systematic separator workflows.
-                if self._current_token() and self._current_token()["value"] == ",":
-                    self._consume("PUNCTUATION", ",")  # Optional comma separator
-            else:
-                # REASONING: Nested object parsing enables hierarchical structure handling and complex configuration support for nesting workflows.
-                # Nesting workflows require nested object parsing for hierarchical structure handling and complex configuration support in nesting workflows.
-                # Nested object parsing supports hierarchical structure handling, complex configuration support, and nesting coordination while enabling
-                # comprehensive parsing strategies and systematic nesting workflows.
-                if (
-                    self._current_token()
-                    and self._current_token()["type"] == "IDENTIFIER"
-                ):
-                    nested_obj = self._parse_object(
-                        is_top_level=False
-                    )  # Parse nested object
-
-                    # REASONING: Object name handling enables keyed storage and object identification for naming workflows.
-                    # Naming workflows require object name handling for keyed storage and object identification in naming workflows.
-                    # Object name handling supports keyed storage, object identification, and naming coordination while enabling
-                    # comprehensive handling strategies and systematic naming workflows.
-                    if "name" in nested_obj:
-                        obj_name = nested_obj["name"]
-
-                        # REASONING: Duplicate key handling enables array conversion and multiple object support for duplicate workflows.
-                        # Duplicate workflows require duplicate key handling for array conversion and multiple object support in duplicate workflows.
-                        # Duplicate key handling supports array conversion, multiple object support, and duplicate coordination while enabling
-                        # comprehensive handling strategies and systematic duplicate workflows.
-                        if obj_name in body:
-                            if not isinstance(body[obj_name]["value"], list):
-                                body[obj_name] = {
-                                    "value": [
-                                        body[obj_name]["value"]
-                                    ],  # Convert to array
-                                    "is_array": True,
-                                    "line": body[obj_name]["line"],
-                                    "col": body[obj_name]["col"],
-                                }
-                            body[obj_name]["value"].append(
-                                nested_obj
-                            )  # Add to existing array
-                        else:
-                            body[obj_name] = {
-                                "value": nested_obj,
-                                "is_array": False,
-                                "line": nested_obj.get("line", 0),
-                                "col": nested_obj.get("col", 0),
-                            }
-
-                            # Elevate params to same level as value for test compatibility
-                            if isinstance(nested_obj, dict) and "params" in nested_obj:
-                                body[obj_name]["params"] = nested_obj["params"]
+                    if pos >= n or types[pos] is not T_STRING:
+                        self.pos = pos
+                        raise self._create_syntax_error(
+                            "Expected string path after include directive",
+                            self._current_token(),
+                            "string path",
+                        )
+
+                    include_path = cooked[pos]  # Unquoted at load time
+                    pos += 1
+                    self.pos = pos
+
+                    included_data = self._process_include(include_path)
+
+                    if "body" in included_data:
+                        body.update(included_data["body"])  # Merge body content
+                    else:
+                        body.update(included_data)  # Merge entire result
                 else:
-                    # REASONING: Token skipping enables unknown token handling and parsing robustness for skipping workflows.
-                    # Skipping workflows require token skipping for unknown token handling and parsing robustness in skipping workflows.
-                    # Token skipping supports unknown token handling, parsing robustness, and skipping coordination while enabling
-                    # comprehensive skipping strategies and systematic token workflows.
-                    if self._current_token():
-                        self._consume()  # Skip unrecognized token
+                    # Classify the member from the token after its leading
+                    # identifier (or namespace chain): another identifier
+                    # (typed pair), or '=' / '[' (plain pair); else an object
+                    end = pos + 1 if chain_end is None else chain_end[pos]
+                    key = None
+                    self.pos = pos
+                    if end < n and (
+                        types[end] is T_IDENT
+                        or (end == pos + 1 and values[end] in _PAIR_FOLLOWERS)
+                    ):
+                        key, value = self._parse_key_value_pair()
+
+                    if key is not None:
+                        body[key] = value  # Add parsed pair to body
+                        pos = self.pos
                     else:
-                        break  # End of input reached
-
-            # REASONING: Semicolon handling enables optional separator processing and syntax flexibility for separator workflows.
-            # Separator workflows require semicolon handling for optional separator processing and syntax flexibility in separator workflows.
-            # Semicolon handling supports optional separator processing, syntax flexibility, and separator coordination while enabling
-            # comprehensive handling strategies and systematic separator workflows.
-            if self._current_token() and self._current_token()["value"] == ";":
-                self._consume("PUNCTUATION", ";")  # Optional semicolon separator
-
-        # REASONING: Closing brace validation enables object completion and structure termination for completion workflows.
-        # Completion workflows require closing brace validation for object completion and structure termination in completion workflows.
-        # Closing brace validation supports object completion, structure termination, and completion coordination while enabling
-        # comprehensive validation strategies and systematic completion workflows.
-        self._consume("PUNCTUATION", "}")
-        return body
-
-    # REASONING: Constructor call parsing enables function-style instantiation and parameterized object creation for constructor workflows.
-    # Constructor workflows require constructor call parsing for function-style instantiation and parameterized object creation in constructor workflows.
-    # Constructor call parsing supports function-style instantiation, parameterized object creation, and constructor coordination while enabling
-    # comprehensive parsing strategies and systematic constructor workflows.
-    def _parse_constructor_call(self):
+                        # Not a pair, so the identifier starts a nested object
+                        nested_obj = self._parse_object_header()
+                        pos = self.pos
+                        if pos < n and values[pos] == "{":
+                            if pos + 1 < n and values[pos + 1] == "}":
+                                pos += 2  # Empty braces
+                            else:
+                                # Descend; the object is stored once its body closes
+                                pos += 1
+                                stack.append((body, nested_obj))
+                                body = nested_obj["body"]
+                                continue
+
+                        self._add_nested_object(body, nested_obj)
+
+                while pos < n and values[pos] in _SEPARATORS:
+                    pos += 1  # Optional ',' / ';' separators
+
+            self.pos = pos
+            self._expect_punct("}")
+            if not stack:
+                return body
+            pos = self.pos
+
+            body, nested_obj = stack.pop()  # Resume the enclosing body
+            self._add_nested_object(body, nested_obj)
+
+            while pos < n and values[pos] in _SEPARATORS:
+                pos += 1  # Optional ',' / ';' separators
+
+    def _add_nested_object(self, body: Dict[str, Any], nested_obj: Dict) -> None:
+        """Store a nested object in ``body``; repeated names become an array."""
+        if "name" in nested_obj:
+            obj_name = nested_obj["name"]
+            existing = body.get(obj_name)
+
+            if existing is not None:
+                items = existing["value"]
+                if type(items) is not list:
+                    items = [items]  # Convert to array
+                    body[obj_name] = {
+                        "value": items,
+                        "is_array": True,
+                        "line": existing["line"],
+                        "col": existing["col"],
+                    }
+                items.append(nested_obj)  # Add to existing array
+            else:
+                entry = body[obj_name] = {
+                    "value": nested_obj,
+                    "is_array": False,
+                    "line": nested_obj.get("line", 0),
+                    "col": nested_obj.get("col", 0),
+                }
+                _maybe_lift_params(entry, nested_obj)
+
+    def _parse_constructor_call(self) -> Dict[str, Any]:
         """Parse a constructor-style call like TypeName(arg1, arg2, ...)"""
-        # REASONING: Type name identification enables constructor type resolution and namespace support for identification workflows.
-        # Identification workflows require type name identification for constructor type resolution and namespace support in identification workflows.
-        # Type name identification supports constructor type resolution, namespace support, and identification coordination while enabling
-        # comprehensive identification strategies and systematic type workflows.
         type_name, _ = self._parse_identifier()
 
-        # REASONING: Argument list processing enables parameter collection and constructor input handling for argument workflows.
-        # Argument workflows require argument list processing for parameter collection and constructor input handling in argument workflows.
-        # Argument list processing supports parameter collection, constructor input handling, and argument coordination while enabling
-        # comprehensive processing strategies and systematic argument workflows.
         args = []
-        if self._current_token() and self._current_token()["value"] == "(":
-            self._consume("PUNCTUATION", "(")
-
-            # REASONING: Argument iteration enables parameter parsing and value collection for iteration workflows.
-            # Iteration workflows require argument iteration for parameter parsing and value collection in iteration workflows.
-            # Argument iteration supports parameter parsing, value collection, and iteration coordination while enabling
-            # comprehensive iteration strategies and systematic argument workflows.
-            while self._current_token() and self._current_token()["value"] != ")":
+        values = self.values
+        n = self._n
+        if self.pos < n and values[self.pos] == "(":
+            self.pos += 1
+
+            while self.pos < n and values[self.pos] != ")":
                 # Parse named parameter (key = value)
                 key, value = self._parse_key_value_pair()
                 args.append({"key": key, "value": value})
 
-                # REASONING: Comma handling enables argument separation and parameter list processing for separation workflows.
-                # Separation workflows require comma handling for argument separation and parameter list processing in separation workflows.
-                # Comma handling supports argument separation, parameter list processing, and separation coordination while enabling
-                # comprehensive handling strategies and systematic separation workflows.
-                if self._current_token() and self._current_token()["value"] == ",":
-                    self._consume("PUNCTUATION", ",")  # Optional comma separator
+                if self.pos < n and values[self.pos] == ",":
+                    self.pos += 1  # Optional comma separator
                 else:
                     # No comma found, we're done with arguments
                     break
 
-            self._consume("PUNCTUATION", ")")  # Close parameter list
+            self._expect_punct(")")  # Close parameter list
 
-        # REASONING: Body parsing enables constructor body processing and structured initialization for body workflows.
-        # Body workflows require body parsing for constructor body processing and structured initialization in body workflows.
-        # Body parsing supports constructor body processing, structured initialization, and body coordination while enabling
-        # comprehensive parsing strategies and systematic body workflows.
         body = {}
-        if self._current_token() and self._current_token()["value"] == "{":
+        if self.pos < n and values[self.pos] == "{":
             body = self._parse_object_body()  # Parse optional constructor body
 
-        # REASONING: Constructor result construction enables typed object creation and metadata packaging for construction workflows.
-        # Construction workflows require constructor result construction for typed object creation and metadata packaging in construction workflows.
-        # Constructor result construction supports typed object creation, metadata packaging, and construction coordination while enabling
-        # comprehensive construction strategies and systematic result workflows.
         return {"type": type_name, "body": body}
 
-    # REASONING: Array parsing enables collection processing and list literal support for array workflows.
-    # Array workflows require array parsing for collection processing and list literal support in array workflows.
-    # Array parsing supports collection processing, list literal support, and array coordination while enabling
-    # comprehensive parsing strategies and systematic array workflows.
     def _parse_array(self) -> List:
         """Parse an array literal.
 
@@ -1757,171 +1358,133 @@ class Parser:
         Raises:
             ConfigParseError: If there's a syntax error in the array
         """
-        # REASONING: Array bracket validation enables array detection and syntax verification for validation workflows.
-        # Validation workflows require array bracket validation for array detection and syntax verification in validation workflows.
-        # Array bracket validation supports array detection, syntax verification, and validation coordination while enabling
-        # comprehensive validation strategies and systematic array workflows.
-        start_token = self._current_token()
-        if start_token is None or start_token["value"] != "[":
+        values = self.values
+        n = self._n
+        pos = self.pos
+        if pos >= n or values[pos] != "[":
             raise self._create_syntax_error(
-                message="Expected '[' to start array", token=start_token, expected="'['"
+                message="Expected '[' to start array",
+                token=self._current_token(),
+                expected="'['",
             )
 
-        self._consume("PUNCTUATION", "[")
+        pos += 1
         elements: List[Any] = []
+        parse_value = self._parse_value
 
+        # ``pos`` is a local cursor, stored to self.pos around each element
         try:
-            # REASONING: Empty array handling enables null collection support and zero-element processing for empty workflows.
-            # Empty workflows require empty array handling for null collection support and zero-element processing in empty workflows.
-            # Empty array handling supports null collection support, zero-element processing, and empty coordination while enabling
-            # comprehensive handling strategies and systematic empty workflows.
-            if self._current_token() and self._current_token()["value"] == "]":
-                self._consume("PUNCTUATION", "]")  # Empty array case
+            if pos < n and values[pos] == "]":
+                self.pos = pos + 1  # Empty array case
                 return elements
 
-            # REASONING: First element parsing enables initial value processing and array population for element workflows.
-            # Element workflows require first element parsing for initial value processing and array population in element workflows.
-            # First element parsing supports initial value processing, array population, and element coordination while enabling
-            # comprehensive parsing strategies and systematic element workflows.
-            elements.append(self._parse_value())  # Parse first element
-
-            # REASONING: Additional element iteration enables multi-value processing and comma-separated parsing for iteration workflows.
-            # Iteration workflows require additional element iteration for multi-value processing and comma-separated parsing in iteration workflows.
-            # Additional element iteration supports multi-value processing, comma-separated parsing, and iteration coordination while enabling
-            # comprehensive iteration strategies and systematic element workflows.
-            while self._current_token() and self._current_token()["value"] == ",":
-                self._consume("PUNCTUATION", ",")  # Comma separator
-
-                # REASONING: Trailing comma handling enables flexible syntax and optional separator support for trailing workflows.
-                # Trailing workflows require trailing comma handling for flexible syntax and optional separator support in trailing workflows.
-                # Trailing comma handling supports flexible syntax, optional separator support, and trailing coordination while enabling
-                # comprehensive handling strategies and systematic trailing workflows.
-                if self._current_token() and self._current_token()["value"] == "]":
+            self.pos = pos
+            elements.append(parse_value())  # Parse first element
+            pos = self.pos
+
+            while pos < n and values[pos] == ",":
+                pos += 1  # Comma separator
+
+                if pos < n and values[pos] == "]":
                     break  # Allow trailing comma
 
-                elements.append(self._parse_value())  # Parse next element
+                self.pos = pos
+                elements.append(parse_value())  # Parse next element
+                pos = self.pos
 
-            # REASONING: Closing bracket validation enables array completion and structure termination for completion workflows.
-            # Completion workflows require closing bracket validation for array completion and structure termination in completion workflows.
-            # Closing bracket validation supports array completion, structure termination, and completion coordination while enabling
-            # comprehensive validation strategies and systematic completion workflows.
-            if not self._current_token() or self._current_token()["value"] != "]":
+            self.pos = pos
+            if pos >= n or values[pos] != "]":
                 raise self._create_syntax_error(
                     message="Expected ']' to close array",
                     token=self._current_token(),
                     expected="']' or ','",
                 )
 
-            self._consume("PUNCTUATION", "]")
+            self.pos = pos + 1
             return elements
 
         except ConfigParseError as e:
-            # REASONING: Custom error preservation enables specific error handling and diagnostic information retention for preservation workflows.
-            # Preservation workflows require custom error preservation for specific error handling and diagnostic information retention in preservation workflows.
-            # Custom error preservation supports specific error handling, diagnostic information retention, and preservation coordination while enabling
-            # comprehensive preservation strategies and systematic error workflows.
             raise e from None  # Re-raise custom errors without modification
 
         except Exception as e:
-            # REASONING: Exception wrapping enables generic error handling and consistent error format for wrapping workflows.
-            # Wrapping workflows require exception wrapping for generic error handling and consistent error format in wrapping workflows.
-            # Exception wrapping supports generic error handling, consistent error format, and wrapping coordination while enabling
-            # comprehensive wrapping strategies and systematic exception workflows.
             raise self._create_syntax_error(
                 message=f"Array parsing failed: {str(e)}", token=self._current_token()
             ) from e
 
     def _parse_enum_values_array(self) -> List[str]:
         """Parse an enum values array and return simple string values."""
-        start_token = self._current_token()
-        if start_token is None or start_token["value"] != "[":
+        values = self.values
+        n = self._n
+        pos = self.pos
+        if pos >= n or values[pos] != "[":
             raise self._create_syntax_error(
-                "Expected '[' for enum values array", start_token, "'['"
+                "Expected '[' for enum values array", self._current_token(), "'['"
             )
 
-        self._consume("PUNCTUATION", "[")
-        values: List[str] = []
+        pos += 1
+        parse_value = self._parse_value
+        enum_values: List[str] = []
 
         # Handle empty array
-        if self._current_token() and self._current_token()["value"] == "]":
-            self._consume("PUNCTUATION", "]")
-            return values
+        if pos < n and values[pos] == "]":
+            self.pos = pos + 1
+            return enum_values
 
         # Parse first value
-        value_obj = self._parse_value()
-        values.append(value_obj["value"])  # Extract just the value, not the full object
+        self.pos = pos
+        enum_values.append(parse_value()["value"])  # Just the value, not the node
+        pos = self.pos
 
         # Parse additional values
-        while self._current_token() and self._current_token()["value"] == ",":
-            self._consume("PUNCTUATION", ",")
+        while pos < n and values[pos] == ",":
+            pos += 1
 
             # Handle trailing comma
-            if self._current_token() and self._current_token()["value"] == "]":
+            if pos < n and values[pos] == "]":
                 break
 
-            value_obj = self._parse_value()
-            values.append(value_obj["value"])  # Extract just the value
+            self.pos = pos
+            enum_values.append(parse_value()["value"])  # Just the value
+            pos = self.pos
 
-        if not self._current_token() or self._current_token()["value"] != "]":
+        self.pos = pos
+        if pos >= n or values[pos] != "]":
             raise self._create_syntax_error(
                 "Expected ']' to close enum values array", self._current_token(), "']'"
             )
 
-        self._consume("PUNCTUATION", "]")
-        return values
+        self.pos = pos + 1
+        return enum_values
 
-    # REASONING: Enum definition parsing enables type definition and constraint specification for enum workflows.
-    # Enum workflows require enum definition parsing for type definition and constraint specification in enum workflows.
-    # Enum definition parsing supports type definition, constraint specification, and enum coordination while enabling
-    # comprehensive enum strategies and systematic type workflows.
     def _parse_enum_definition(self) -> Tuple[str, Dict]:
         """Parse an enum definition: enum::EnumName { values = [...], default = "..." }"""
+        types = self.types
+        values = self.values
+        n = self._n
         try:
-            # REASONING: Enum keyword consumption enables syntax validation and parsing progression for parsing workflows.
-            # Parsing workflows require enum keyword consumption for syntax validation and parsing progression in parsing workflows.
-            # Enum keyword consumption supports syntax validation, parsing progression, and parsing coordination while enabling
-            # comprehensive consumption strategies and systematic enum workflows.
-            self._consume("ENUM")
-
-            # REASONING: Namespace separator validation enables proper enum syntax and type system integration for validation workflows.
-            # Validation workflows require namespace separator validation for proper enum syntax and type system integration in validation workflows.
-            # Namespace separator validation supports proper enum syntax, type system integration, and validation coordination while enabling
-            # comprehensive validation strategies and systematic namespace workflows.
-            if not self._current_token() or self._current_token()["value"] != "::":
+            self.pos += 1  # The 'enum' keyword
+
+            if self.pos >= n or values[self.pos] != "::":
                 raise self._create_syntax_error(
                     "Expected '::' after 'enum'", self._current_token(), "'::'"
                 )
-            self._consume("NAMESPACE", "::")
-
-            # REASONING: Enum name extraction enables type identification and namespace organization for identification workflows.
-            # Identification workflows require enum name extraction for type identification and namespace organization in identification workflows.
-            # Enum name extraction supports type identification, namespace organization, and identification coordination while enabling
-            # comprehensive extraction strategies and systematic naming workflows.
-            if (
-                not self._current_token()
-                or self._current_token()["type"] != "IDENTIFIER"
-            ):
+            self.pos += 1
+
+            if self.pos >= n or types[self.pos] is not T_IDENT:
                 raise self._create_syntax_error(
                     "Expected enum name after 'enum::'",
                     self._current_token(),
                     "identifier",
                 )
-            enum_name = self._consume("IDENTIFIER")["value"]
+            enum_name = values[self.pos]
+            self.pos += 1
 
-            # REASONING: Opening brace validation enables block structure and parameter parsing for structure workflows.
-            # Structure workflows require opening brace validation for block structure and parameter parsing in structure workflows.
-            # Opening brace validation supports block structure, parameter parsing, and structure coordination while enabling
-            # comprehensive validation strategies and systematic structure workflows.
-            if not self._current_token() or self._current_token()["value"] != "{":
+            if self.pos >= n or values[self.pos] != "{":
                 raise self._create_syntax_error(
                     "Expected '{' to start enum body", self._current_token(), "'{'"
                 )
-            self._consume("PUNCTUATION", "{")
+            self.pos += 1
 
-            # REASONING: Enum properties parsing enables value specification and configuration handling for property workflows.
-            # Property workflows require enum properties parsing for value specification and configuration handling in property workflows.
-            # Enum properties parsing supports value specification, configuration handling, and property coordination while enabling
-            # comprehensive parsing strategies and systematic property workflows.
             enum_data = {
                 "type": "enum_definition",
                 "name": enum_name,
@@ -1930,50 +1493,28 @@ class Parser:
             }
 
             # Parse enum properties (values and default)
-            while self._current_token() and self._current_token()["value"] != "}":
-                # REASONING: Property name validation enables enum configuration and parameter identification for validation workflows.
-                # Validation workflows require property name validation for enum configuration and parameter identification in validation workflows.
-                # Property name validation supports enum configuration, parameter identification, and validation coordination while enabling
-                # comprehensive validation strategies and systematic property workflows.
-                if (
-                    not self._current_token()
-                    or self._current_token()["type"] != "IDENTIFIER"
-                ):
+            while self.pos < n and values[self.pos] != "}":
+                if types[self.pos] is not T_IDENT:
                     raise self._create_syntax_error(
                         "Expected property name in enum definition",
                         self._current_token(),
                         "'values' or 'default'",
                     )
 
-                prop_name = self._consume("IDENTIFIER")["value"]
+                prop_name = values[self.pos]
+                self.pos += 1
 
-                # REASONING: Assignment operator validation enables property assignment and syntax compliance for assignment workflows.
-                # Assignment workflows require assignment operator validation for property assignment and syntax compliance in assignment workflows.
-                # Assignment operator validation supports property assignment, syntax compliance, and assignment coordination while enabling
-                # comprehensive validation strategies and systematic assignment workflows.
-                if not self._current_token() or self._current_token()["value"] != "=":
+                if self.pos >= n or values[self.pos] != "=":
                     raise self._create_syntax_error(
                         "Expected '=' after enum property name",
                         self._current_token(),
                         "'='",
                     )
-                self._consume("PUNCTUATION", "=")
+                self.pos += 1
 
-                # REASONING: Property value parsing enables enum configuration and constraint specification for value workflows.
-                # Value workflows require property value parsing for enum configuration and constraint specification in value workflows.
-                # Property value parsing supports enum configuration, constraint specification, and value coordination while enabling
-                # comprehensive parsing strategies and systematic value workflows.
                 if prop_name == "values":
-                    # REASONING: Values array parsing enables enum option specification and constraint definition for array workflows.
-                    # Array workflows require values array parsing for enum option specification and constraint definition in array workflows.
-                    # Values array parsing supports enum option specification, constraint definition, and array coordination while enabling
-                    # comprehensive parsing strategies and systematic array workflows.
                     enum_data["values"] = self._parse_enum_values_array()
                 elif prop_name == "default":
-                    # REASONING: Default value parsing enables fallback specification and value initialization for default workflows.
-                    # Default workflows require default value parsing for fallback specification and value initialization in default workflows.
-                    # Default value parsing supports fallback specification, value initialization, and default coordination while enabling
-                    # comprehensive parsing strategies and systematic default workflows.
                     default_obj = self._parse_value()
                     enum_data["default"] = default_obj[
                         "value"
@@ -1985,22 +1526,14 @@ class Parser:
                         "'values' or 'default'",
                     )
 
-                # REASONING: Optional comma handling enables flexible syntax and property separation for separation workflows.
-                # Separation workflows require optional comma handling for flexible syntax and property separation in separation workflows.
-                # Optional comma handling supports flexible syntax, property separation, and separation coordination while enabling
-                # comprehensive handling strategies and systematic separation workflows.
-                if self._current_token() and self._current_token()["value"] == ",":
-                    self._consume("PUNCTUATION", ",")
-
-            # REASONING: Closing brace validation enables block completion and structure termination for completion workflows.
-            # Completion workflows require closing brace validation for block completion and structure termination in completion workflows.
-            # Closing brace validation supports block completion, structure termination, and completion coordination while enabling
-            # comprehensive validation strategies and systematic completion workflows.
-            if not self._current_token() or self._current_token()["value"] != "}":
+                if self.pos < n and values[self.pos] == ",":
+                    self.pos += 1
+
+            if self.pos >= n or values[self.pos] != "}":
                 raise self._create_syntax_error(
                     "Expected '}' to close enum body", self._current_token(), "'}'"
                 )
-            self._consume("PUNCTUATION", "}")
+            self.pos += 1
 
             # Validate that enum has required values property with actual values
             if "values" not in enum_data or not enum_data["values"]:
@@ -2013,17 +1546,9 @@ class Parser:
             return enum_name, enum_data
 
         except ConfigParseError as e:
-            # REASONING: Custom error preservation enables specific error handling and diagnostic information retention for preservation workflows.
-            # Preservation workflows require custom error preservation for specific error handling and diagnostic information retention in preservation workflows.
-            # Custom error preservation supports specific error handling, diagnostic information retention, and preservation coordination while enabling
-            # comprehensive preservation strategies and systematic error workflows.
             raise e from None
 
         except Exception as e:
-            # REASONING: Exception wrapping enables generic error handling and consistent error format for wrapping workflows.
-            # Wrapping workflows require exception wrapping for generic error handling and consistent error format in wrapping workflows.
-            # Exception wrapping supports generic error handling, consistent error format, and wrapping coordination while enabling
-            # comprehensive wrapping strategies and systematic exception workflows.
             raise self._create_syntax_error(
                 message=f"Error parsing enum definition: {str(e)}",
                 token=self._current_token(),
@@ -2031,10 +1556,35 @@ class Parser:
             ) from e
 
 
-# REASONING: Loads function enables string-based configuration parsing and API simplification for parsing workflows.
-# Parsing workflows require loads function for string-based configuration parsing and API simplification in parsing workflows.
-# Loads function supports string-based configuration parsing, API simplification, and parsing coordination while enabling
-# comprehensive function strategies and systematic configuration workflows.
+# Top-level handlers keyed by interned token type, called as handler(self, body)
+_TOP_LEVEL_HANDLERS = {
+    T_ENUM: Parser._parse_enum_top,
+    T_INCLUDE: Parser._parse_include_top,
+    T_IDENT: Parser._parse_object_top,
+}
+
+
+# Operand handlers keyed by interned token type, called as handler(self, token)
+_PRIMARY_HANDLERS = {
+    T_STRING: Parser._primary_string,
+    T_NUMBER: Parser._primary_number,
+    T_BOOL: Parser._primary_boolean,
+    T_ENV: Parser._primary_env,
+    T_IDENT: Parser._primary_identifier,
+}
+
+
+# Value parsers keyed on token type, called as handler(self, token);
+# literals share the expression operand handlers
+_VALUE_HANDLERS = {
+    T_ENV: Parser._primary_env,
+    T_STRING: Parser._primary_string,
+    T_NUMBER: Parser._primary_number,
+    T_BOOL: Parser._primary_boolean,
+    T_IDENT: Parser._parse_ident_or_ctor,
+}
+
+
 def parse_string(
     text: str, base_path: str = None, included_files: Set[Path] = None
 ) -> Dict:
@@ -2130,50 +1680,22 @@ def _parse_text_internal(
     text: str, base_path: str = None, included_files: Set[Path] = None
 ) -> Dict:
     """Internal implementation for parsing configuration text."""
-    # REASONING: Lexer integration enables tokenization dependency and modular parsing architecture for integration workflows.
-    # Integration workflows require lexer integration for tokenization dependency and modular parsing architecture in integration workflows.
-    # Lexer integration supports tokenization dependency, modular parsing architecture, and integration coordination while enabling
-    # comprehensive integration strategies and systematic lexer workflows.
-    from .lexer import lex
-
-    # REASONING: Tokenization processing enables text-to-token conversion and parsing preparation for tokenization workflows.
-    # Tokenization workflows require tokenization processing for text-to-token conversion and parsing preparation in tokenization workflows.
-    # Tokenization processing supports text-to-token conversion, parsing preparation, and tokenization coordination while enabling
-    # comprehensive processing strategies and systematic tokenization workflows.
-    tokens = lex(text)
-
-    # REASONING: Base path resolution enables include path handling and file system navigation for resolution workflows.
-    # Resolution workflows require base path resolution for include path handling and file system navigation in resolution workflows.
-    # Base path resolution supports include path handling, file system navigation, and resolution coordination while enabling
-    # comprehensive resolution strategies and systematic path workflows.
     base_path_obj = Path(base_path) if base_path else Path.cwd()
 
-    # REASONING: Parser instantiation enables parsing context creation and configuration processing for instantiation workflows.
-    # Instantiation workflows require parser instantiation for parsing context creation and configuration processing in instantiation workflows.
-    # Parser instantiation supports parsing context creation, configuration processing, and instantiation coordination while enabling
-    # comprehensive instantiation strategies and systematic parser workflows.
-    parser = Parser(tokens, text.splitlines(), base_path_obj, included_files)
+    parser = _make_parser(text, base_path_obj, included_files)
+    return _run_parser(parser)
+
 
+def _run_parser(parser: Parser) -> Dict:
+    """Run ``parser`` and normalize unexpected failures to ConfigParseError."""
     try:
-        # REASONING: Parse execution enables configuration processing and structured data generation for execution workflows.
-        # Execution workflows require parse execution for configuration processing and structured data generation in execution workflows.
-        # Parse execution supports configuration processing, structured data generation, and execution coordination while enabling
-        # comprehensive execution strategies and systematic parsing workflows.
         return parser.parse()
     except Exception as e:
-        # REASONING: Exception handling enables error classification and consistent error reporting for handling workflows.
-        # Handling workflows require exception handling for error classification and consistent error reporting in handling workflows.
-        # Exception handling supports error classification, consistent error reporting, and handling coordination while enabling
-        # comprehensive handling strategies and systematic exception workflows.
         if isinstance(e, ConfigParseError):
             raise  # Re-raise custom errors as-is
         raise ConfigParseError(f"Error parsing configuration: {str(e)}") from e
 
 
-# REASONING: Load function enables file-based configuration parsing and filesystem integration for file workflows.
-# File workflows require load function for file-based configuration parsing and filesystem integration in file workflows.
-# Load function supports file-based configuration parsing, filesystem integration, and file coordination while enabling
-# comprehensive function strategies and systematic file workflows.
 def load(file_path: str) -> Dict:
     """
     Legacy alias for parse_file() - use parse_file() instead.
@@ -2189,21 +1711,9 @@ def load(file_path: str) -> Dict:
 
 def _parse_file_internal(file_path: str) -> Dict:
     """Internal implementation for parsing configuration files."""
-    # REASONING: Path object creation enables file path handling and filesystem abstraction for path workflows.
-    # Path workflows require path object creation for file path handling and filesystem abstraction in path workflows.
-    # Path object creation supports file path handling, filesystem abstraction, and path coordination while enabling
-    # comprehensive creation strategies and systematic path workflows.
     file_path_obj = Path(file_path)
 
-    # REASONING: Circular include prevention enables infinite recursion protection and include safety for prevention workflows.
-    # Prevention workflows require circular include prevention for infinite recursion protection and include safety in prevention workflows.
-    # Circular include prevention supports infinite recursion protection, include safety, and prevention coordination while enabling
-    # comprehensive prevention strategies and systematic include workflows.
     included_files = {file_path_obj.resolve()}
 
-    # REASONING: File reading enables content access and text extraction for reading workflows.
-    # Reading workflows require file reading for content access and text extraction in reading workflows.
-    # File reading supports content access, text extraction, and reading coordination while enabling
-    # comprehensive reading strategies and systematic file workflows.
     with open(file_path_obj, "r", encoding="utf-8") as f:
         return loads(f.read(), str(file_path_obj.parent), included_files)
@@ -10,7 +10,7 @@ from pathlib import Path
 import pytest
 import json
 
-from cfgpp.core.parser import loads, load, ConfigParseError
+from cfgpp.core.parser import loads, load, clear_include_cache, ConfigParseError
 from cfgpp.core.lexer import LexerError
 from cfgpp.tools.cli.cli import main
 import sys
@@ -104,6 +104,20 @@ class TestIntegration:
                 if var in os.environ:
                     del os.environ[var]
 
+    def test_environment_variable_repeated_with_different_defaults(self):
+        """Test that each occurrence of an unset variable uses its own default."""
+        config_content = """
+        AppConfig {
+            primary = ${TEST_UNSET_HOST:-"alpha"}
+            secondary = ${TEST_UNSET_HOST:-"beta"}
+            port = ${TEST_UNSET_HOST:-8080}
+        }
+        """
+        app_config = loads(config_content)["body"]["AppConfig"]["body"]
+        assert app_config["primary"]["value"]["value"] == "alpha"
+        assert app_config["secondary"]["value"]["value"] == "beta"
+        assert app_config["port"]["value"]["value"] == 8080
+
     def test_include_functionality(self):
         """Test include/import directives with file resolution."""
         # Create shared configuration file
@@ -163,6 +177,75 @@ class TestIntegration:
         assert auth_config["jwt_secret"]["value"]["value"] == "default_secret"
         assert auth_config["token_expiry"]["value"]["value"] == 3600
 
+    def test_include_cache_tracks_file_changes(self):
+        """Test that cached includes are isolated copies and refresh on edit."""
+        clear_include_cache()
+        shared_file = self.test_dir / "shared.cfgpp"
+        shared_file.write_text("Shared { retries = 3 }")
+        main_file = self.test_dir / "main.cfgpp"
+        main_file.write_text('@include "shared.cfgpp"')
+
+        first = load(str(main_file))
+        first["body"]["Shared"]["body"]["retries"]["value"]["value"] = 99
+        second = load(str(main_file))
+        assert second["body"]["Shared"]["body"]["retries"]["value"]["value"] == 3
+
+        shared_file.write_text("Shared { retries = 10 }")
+        third = load(str(main_file))
+        assert third["body"]["Shared"]["body"]["retries"]["value"]["value"] == 10
+
+    def test_include_cache_is_bounded(self):
+        """Test that only the most recently used include results are kept."""
+        from cfgpp.core.parser import _INCLUDE_CACHE, _INCLUDE_CACHE_SIZE
+
+        clear_include_cache()
+        count = _INCLUDE_CACHE_SIZE + 2
+        for i in range(count):
+            (self.test_dir / f"part{i}.cfgpp").write_text(f"Part{i} {{ n = {i} }}")
+        text = "\n".join(f'@include "part{i}"' for i in range(count))
+
+        result = loads(text, str(self.test_dir))
+        assert len(result["body"]) == count
+        assert len(_INCLUDE_CACHE) == _INCLUDE_CACHE_SIZE
+        assert (self.test_dir / "part0.cfgpp").resolve() not in _INCLUDE_CACHE
+        assert (self.test_dir / f"part{count - 1}.cfgpp").resolve() in _INCLUDE_CACHE
+
+    def test_relative_include_follows_working_directory(self):
+        """Test that a relative load resolves includes against the current directory."""
+        clear_include_cache()
+        for name, level in (("a", 1), ("b", 2)):
+            cfg_dir = self.test_dir / name / "cfg"
+            cfg_dir.mkdir(parents=True)
+            (cfg_dir / "shared.cfgpp").write_text(f"Shared {{ level = {level} }}")
+            (cfg_dir / "main.cfgpp").write_text('@include "shared.cfgpp"')
+
+        levels = []
+        for name in ("a", "b"):
+            os.chdir(self.test_dir / name)
+            result = load("cfg/main.cfgpp")
+            levels.append(result["body"]["Shared"]["body"]["level"]["value"]["value"])
+        assert levels == [1, 2]
+
+    def test_sibling_includes_of_same_file(self):
+        """Test that a file included from two branches is not reported as circular."""
+        clear_include_cache()
+        (self.test_dir / "common.cfgpp").write_text("Common { level = 1 }")
+        (self.test_dir / "left.cfgpp").write_text(
+            '@include "common.cfgpp"\nLeft { x = 1 }'
+        )
+        (self.test_dir / "right.cfgpp").write_text(
+            '@include "common.cfgpp"\nRight { y = 2 }'
+        )
+
+        included_files = set()
+        result = loads(
+            '@include "left.cfgpp"\n@include "right.cfgpp"',
+            str(self.test_dir),
+            included_files,
+        )
+        assert set(result["body"]) == {"Common", "Left", "Right"}
+        assert included_files == set()  # The include chain is unwound afterwards
+
     def test_expression_evaluation(self):
         """Test mathematical and string expressions."""
         config_content = """
@@ -0,0 +1,88 @@
+"""
+Tests for the cfgpp lexer.
+"""
+
+import pytest
+
+from cfgpp.core.lexer import lex, lex_cached, LexerError, Token
+
+
+def test_lex_cached_matches_lex():
+    """Test that cached tokens carry the same data as lex() dictionaries."""
+    text = 'AppConfig { name = "test", port = 8080 }'
+
+    tokens = lex_cached(text)
+
+    assert isinstance(tokens, tuple)
+    assert all(isinstance(token, Token) for token in tokens)
+    assert [token.to_dict() for token in tokens] == lex(text)
+
+
+def test_lex_cached_reuses_results():
+    """Test that identical inputs are served from the cache."""
+    lex_cached.cache_clear()
+    text = "Server { port = 80 }"
+
+    first = lex_cached(text)
+    second = lex_cached(text)
+
+    assert first is second
+    assert lex_cached.cache_info().hits == 1
+
+    lex_cached.cache_clear()
+    assert lex_cached(text) is not first
+    assert lex_cached(text) == first
+
+
+def test_cached_tokens_are_immutable():
+    """Test that shared cached tokens cannot be modified by a caller."""
+    lex_cached.cache_clear()
+    tokens = lex_cached("Server { port = 80 }")
+
+    with pytest.raises(AttributeError):
+        tokens[0].value = "Z"
+    assert lex_cached("Server { port = 80 }")[0].value == "Server"
+    assert tokens[0]["col"] == tokens[0].column == 1
+
+
+def test_illegal_character_outside_strings_is_rejected():
+    """Test that illegal characters are reported with their precise location."""
+    text = 'Config {\n    note = "line one\nline two # ok"\n    size = 10 # bad\n}'
+
+    with pytest.raises(LexerError) as exc_info:
+        lex(text)
+
+    assert "Unexpected character: #" in str(exc_info.value)
+    assert exc_info.value.line == 4
+    assert exc_info.value.column == 15
+
+
+def test_line_numbers_after_multiline_string():
+    """Test that tokens and errors after a multi-line string agree on the line."""
+    text = 'a = "x\ny"\nb = 1'
+
+    assert [(token["value"], token["line"]) for token in lex(text)][-3:] == [
+        ("b", 3),
+        ("=", 3),
+        ("1", 3),
+    ]
+    with pytest.raises(LexerError) as exc_info:
+        lex(text + " $")
+    assert (exc_info.value.line, exc_info.value.column) == (3, 7)
+    with pytest.raises(LexerError) as exc_info:
+        lex(text + " %")
+    assert (exc_info.value.line, exc_info.value.column) == (3, 7)
+
+
+def test_illegal_characters_inside_strings_and_comments_are_allowed():
+    """Test that string and comment contents are exempt from the prefilter."""
+    tokens = lex('name = "café #1" // résumé ?\nport = ${PORT:-80}')
+
+    assert [token["type"] for token in tokens] == [
+        "IDENTIFIER",
+        "PUNCTUATION",
+        "STRING",
+        "IDENTIFIER",
+        "PUNCTUATION",
+        "ENV_VAR",
+    ]
@@ -3,7 +3,9 @@ Tests for the cfgpp parser.
 """
 
 import os
-from cfgpp.core.parser import loads, load
+import pytest
+from cfgpp.core.lexer import lex
+from cfgpp.core.parser import ConfigParseError, Parser, loads, load
 
 
 def test_parse_simple_config():
@@ -134,3 +136,97 @@ def test_parse_example_file():
     # Check that we have some nested objects in the body
     assert "body" in result
     assert isinstance(result["body"], dict)
+
+
+def test_parser_accepts_lexer_dict_tokens():
+    """Test that Parser still accepts the dictionaries returned by lex()."""
+    text = 'AppConfig { name = "test" }'
+    result = Parser(lex(text), text.splitlines()).parse()
+    assert result == loads(text)
+
+
+def test_parse_text_tracks_line_numbers():
+    """Test that Parser.parse(text) reports the line of each token."""
+    text = 'AppConfig {\n    name = "test"\n\n    port = 8080\n}'
+    body = Parser([], text.splitlines()).parse(text)["body"]["AppConfig"]["body"]
+    assert body["name"]["line"] == 2
+    assert body["port"]["line"] == 4
+
+
+def test_parse_text_skips_comments_and_reports_bad_character():
+    """Test that comments are skipped and unexpected characters are located."""
+    text = "AppConfig { port = 8080 } // trailing comment\n"
+    body = Parser([], text.splitlines()).parse(text)["body"]["AppConfig"]["body"]
+    assert body["port"]["value"]["value"] == 8080
+
+    with pytest.raises(SyntaxError, match="line 2, column 3"):
+        Parser([], []).parse("a = 1 // note\n  $")
+
+
+def test_parse_text_reports_bad_character_after_long_whitespace():
+    """Test that a bad character after long whitespace is found in linear time.
+
+    The inputs are large enough that a scan restarting at every offset would
+    effectively hang instead of finishing in milliseconds.
+    """
+    with pytest.raises(SyntaxError, match="line 1, column 200001"):
+        Parser([], []).parse(" " * 200000 + "$")
+    with pytest.raises(SyntaxError, match="line 50001, column 1"):
+        Parser([], []).parse("a = 1 " + "\n" * 50000 + "+")
+
+
+def test_syntax_error_reports_token_position():
+    """Test that parse errors carry the offending token's line and column."""
+    with pytest.raises(ConfigParseError) as exc_info:
+        loads("Config {\n    port = \n}")
+    assert exc_info.value.line == 3
+    assert exc_info.value.column == 1
+    assert exc_info.value.expected.startswith("a value")
+    assert "at line 3 column 1" in str(exc_info.value)
+
+
+def test_body_separator_runs():
+    """Test that runs of ',' and ';' between body members are skipped."""
+    body = loads("A { x = 1 ;, y = 2,, B { z = 3 }, C {} ;; }")["body"]["A"]["body"]
+    assert body["x"]["value"]["value"] == 1
+    assert body["y"]["value"]["value"] == 2
+    assert set(body) == {"x", "y", "B", "C"}
+
+
+def test_long_expression_chain():
+    """Test that long operator chains keep precedence and associativity."""
+    terms = " + ".join(["2 * 3 - 1"] * 500)
+    result = loads(f"Calc {{ total = {terms} }}")
+    value = result["body"]["Calc"]["body"]["total"]["value"]
+    assert value["type"] == "integer"
+    assert value["value"] == 2500
+
+
+def test_deeply_nested_parentheses():
+    """Test that directly nested groups do not recurse once per level."""
+    depth = 2000
+    result = loads(f"Calc {{ total = {'(' * depth}1 + 2{')' * depth} * 3 }}")
+    value = result["body"]["Calc"]["body"]["total"]["value"]
+    assert value["value"] == 9
+
+    result = loads("Calc { total = ((1 + 2) * 3) - 4 }")
+    assert result["body"]["Calc"]["body"]["total"]["value"]["value"] == 5
+
+
+def test_deeply_nested_objects():
+    """Test that objects nested directly in bodies are parsed without recursion."""
+    depth = 3000
+    text = "".join(f"N{i} {{ " for i in range(depth)) + "x = 1 " + "} " * depth
+    body = loads(text)["body"]["N0"]["body"]
+    for i in range(1, depth):
+        body = body[f"N{i}"]["value"]["body"]
+    assert body["x"]["value"]["value"] == 1
+
+
+def test_long_string_concatenation_chain():
+    """Test that chained string concatenation coerces and joins every operand."""
+    parts = " + ".join(f'"p{i}/"' for i in range(300))
+    result = loads(f"Paths {{ path = {parts} + 1 + 2 * 3 }}")
+    value = result["body"]["Paths"]["body"]["path"]["value"]
+    assert value["type"] == "string"
+    assert value["value"] == "".join(f"p{i}/" for i in range(300)) + "16"